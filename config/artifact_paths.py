@@ -1,11 +1,55 @@
+import os
 from pathlib import Path
 
+# Each path is built with a single joinpath call (one Path construction per constant)
 ARTIFACT_ROOT = Path("test_artifacts")
-ALLURE_REPORTS_DIR = ARTIFACT_ROOT / "allure" / "allure_reports"
-ALLURE_RESULTS_DIR = ARTIFACT_ROOT / "allure" / "allure_results"
-SCREENSHOT_DIR = ARTIFACT_ROOT / "allure" / "screenshots"
-AI_HEALING_REPORT_DIR = ARTIFACT_ROOT / "ai" / "ai_healing_reports"
-VISUAL_BASELINE_DIR = ARTIFACT_ROOT / "visual" / "visual_baselines"
-VISUAL_CURRENT_DIR = ARTIFACT_ROOT / "visual" / "visual_current"
-VISUAL_DIFF_DIR = ARTIFACT_ROOT / "visual" / "visual_diffs"
-PERFORMANCE_REPORT_DIR = ARTIFACT_ROOT / "performance" / "performance_reports"
+ALLURE_ROOT = ARTIFACT_ROOT.joinpath("allure")
+ALLURE_REPORTS_DIR = ALLURE_ROOT.joinpath("allure-report")
+ALLURE_RESULTS_DIR = ALLURE_ROOT.joinpath("allure-results")
+ALLURE_SCREENSHOT_DIR = SCREENSHOT_DIR = ALLURE_ROOT.joinpath("screenshots")
+AI_HEALING_REPORT_DIR = ARTIFACT_ROOT.joinpath("ai", "ai_healing_reports")
+VISUAL_BASELINE_DIR = ARTIFACT_ROOT.joinpath("visual", "visual_baselines")
+VISUAL_CURRENT_DIR = ARTIFACT_ROOT.joinpath("visual", "visual_current")
+VISUAL_DIFF_DIR = ARTIFACT_ROOT.joinpath("visual", "visual_diffs")
+PERFORMANCE_REPORT_DIR = ARTIFACT_ROOT.joinpath("performance", "performance_reports")
+HEALED_SELECTORS_FILE = AI_HEALING_REPORT_DIR.joinpath("healed_selectors.json")
+
+ARTIFACT_DIRS = (
+    ALLURE_REPORTS_DIR,
+    ALLURE_RESULTS_DIR,
+    SCREENSHOT_DIR,
+    AI_HEALING_REPORT_DIR,
+    VISUAL_BASELINE_DIR,
+    VISUAL_CURRENT_DIR,
+    VISUAL_DIFF_DIR,
+    PERFORMANCE_REPORT_DIR,
+)
+
+# Every artifact directory plus its parents, deduplicated, shallowest first and
+# converted to plain strings once so os.mkdir never has to go through __fspath__
+_ALL_DIRS = tuple(str(p) for p in sorted(
+    {p for d in ARTIFACT_DIRS for p in (d, *d.parents) if p.parts},
+    key=lambda p: len(p.parts),
+))
+
+# Directories already known to exist in this process
+_created = set()
+
+# ------------------------------------------------------------------------------
+# Function: ensure_directories
+# ------------------------------------------------------------------------------
+
+def ensure_directories():
+    """
+    Create all artifact directories if they do not already exist.
+    Each shared parent is created once, in depth order, and created paths are
+    remembered so repeat calls do not touch the filesystem.
+    """
+    for path in _ALL_DIRS:
+        if path in _created:
+            continue
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        _created.add(path)
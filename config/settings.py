@@ -3,50 +3,110 @@ Configuration settings for the test framework.
 Loads environment variables and provides default values.
 """
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
 from dotenv import load_dotenv
+from config.artifact_paths import ALLURE_RESULTS_DIR as DEFAULT_ALLURE_RESULTS_DIR
 
-# Load environment variables from .env file
-env = os.getenv("ENV", "dev")  # default to 'dev' if ENV is not set
-dotenv_file = f".env.{env}"
-load_dotenv(".env")  # always load base first
-load_dotenv(dotenv_file, override=False)
 
+# (ENV, .env mtime, .env.<ENV> mtime) keys already loaded. Looked up in globals()
+# so the record survives importlib.reload(), which re-runs this module in place.
+_DOTENV_LOADED = globals().get("_DOTENV_LOADED", set())
+
+
+def _mtime(path: str) -> float:
+    """Return the file's modification time, or 0 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+
+def _load_env() -> dict:
+    """
+    Load the .env files and return a snapshot of the environment.
+    The files are only parsed again if ENV changes or one of them is modified.
+    """
+    env = os.environ.get("ENV", "dev")  # default to 'dev' if ENV is not set
+    dotenv_file = f".env.{env}"
+    key = (env, _mtime(".env"), _mtime(dotenv_file))
+    if key not in _DOTENV_LOADED:
+        load_dotenv(".env")  # always load base first
+        load_dotenv(dotenv_file, override=False)
+        _DOTENV_LOADED.add(key)
+    return dict(os.environ)
+
+
+# Frozen snapshot of the environment taken after the .env files are loaded
+_ENV = _load_env()
+
+
+def _get(key: str, default: str) -> str:
+    """Read a raw string value from the environment snapshot."""
+    return _ENV.get(key, default)
+
+
+def _bool(key: str, default: str) -> bool:
+    """Read a boolean flag ("true"/"false") from the environment snapshot."""
+    return _ENV.get(key, default).lower() == "true"
+
+
+def _int(key: str, default: str) -> int:
+    """Read an integer value from the environment snapshot."""
+    return int(_ENV.get(key, default))
+
+
+@dataclass(frozen=True)
 class Settings:
     """Application settings loaded from environment variables."""
     # Base URL Configuration
-    BASE_URL: str = os.getenv("BASE_URL", "https://the-internet.herokuapp.com")
-    
+    BASE_URL: str = _get("BASE_URL", "https://the-internet.herokuapp.com")
+
     # Browser Configuration
-    BROWSER: str = os.getenv("BROWSER", "chromium")
-    HEADLESS: bool = os.getenv("HEADLESS", "false").lower() == "true"
-    SLOW_MO: int = int(os.getenv("SLOW_MO", "100"))
-    TIMEOUT: int = int(os.getenv("TIMEOUT", "30000"))
-    
+    BROWSER: str = _get("BROWSER", "chromium")
+    HEADLESS: bool = _bool("HEADLESS", "false")
+    SLOW_MO: int = _int("SLOW_MO", "100")
+    TIMEOUT: int = _int("TIMEOUT", "30000")
+
     # Test Configuration
-    RETRY_COUNT: int = int(os.getenv("RETRY_COUNT", "3"))
-    RETRY_DELAY: int = int(os.getenv("RETRY_DELAY", "1000"))
-    SCREENSHOT_ON_FAILURE: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
-    VIDEO_ON_FAILURE: bool = os.getenv("VIDEO_ON_FAILURE", "true").lower() == "true"
-    
+    RETRY_COUNT: int = _int("RETRY_COUNT", "3")
+    RETRY_DELAY: int = _int("RETRY_DELAY", "1000")
+    SCREENSHOT_ON_FAILURE: bool = _bool("SCREENSHOT_ON_FAILURE", "true")
+    VIDEO_ON_FAILURE: bool = _bool("VIDEO_ON_FAILURE", "true")
+    # Fail the run if any test's call phase takes longer than this (0 disables)
+    MAX_TEST_DURATION_MS: int = _int("MAX_TEST_DURATION_MS", "0")
+    # Replay BASE_URL traffic in module-scoped contexts from this HAR file (empty disables);
+    # with HAR_UPDATE=true the file is recorded from the live site instead
+    HAR_FILE: str = _get("HAR_FILE", "")
+    HAR_UPDATE: bool = _bool("HAR_UPDATE", "false")
+    # Let page objects swap in selectors cached by AI healing (each swap is logged)
+    USE_HEALED_SELECTORS: bool = _bool("USE_HEALED_SELECTORS", "false")
+
     # Allure Configuration - not using atm
-    ALLURE_RESULTS_DIR: str = os.getenv("ALLURE_RESULTS_DIR", "test_artifacts/allure/allure-results")
+    ALLURE_RESULTS_DIR: str = _get("ALLURE_RESULTS_DIR", str(DEFAULT_ALLURE_RESULTS_DIR))
 
-    DEBUG_MSG: bool = os.getenv("DEBUG_MSG", "false").lower() == "true" 
+    DEBUG_MSG: bool = _bool("DEBUG_MSG", "false")
 
     @classmethod
     def get_browser_options(cls) -> dict:
-        """Get browser launch options."""
-        return {
-            "headless": cls.HEADLESS,
-            "slow_mo": cls.SLOW_MO,
-            "args": [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-extensions",
-                "--no-sandbox",
-                "--disable-dev-shm-usage"
-            ]
-        }
+        """Get browser launch options (a fresh copy the caller may modify)."""
+        options = dict(_BROWSER_OPTIONS)
+        options["args"] = list(_BROWSER_ARGS)
+        return options
+
 
+# Browser launch arguments and options, frozen once at import
+_BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+)
+_BROWSER_OPTIONS = MappingProxyType({
+    "headless": Settings.HEADLESS,
+    "slow_mo": Settings.SLOW_MO,
+    "args": _BROWSER_ARGS,
+})
 
 # Create a global settings instance
 settings = Settings()
@@ -62,15 +62,12 @@ Date: [2025-07-29]
 
 import os
 import json
-import allure
+import functools
 import pytest
 import pytest_asyncio
 from config.settings import settings
 from playwright.async_api import Locator, TimeoutError as PlaywrightTimeoutError
-import threading
-from collections import defaultdict
 import asyncio
-from utils.ai_healing import get_ollama_service, find_page_object, ensure_ollama_ready
 from utils.browserstack import is_browserstack_enabled
 from utils.debug import debug_print
 from playwright.async_api import async_playwright
@@ -84,11 +81,61 @@ from utils.network_mocking import api_mocker
 # Pytest fixtures (prevents auto-removal)
 pytest_fixtures = [visual_regression, api_mocker]
 
-# Thread-safe dictionary and lock for tracking test failure counts
-_ai_healing_fail_counts = defaultdict(int)
-_ai_healing_lock = threading.Lock()
+# (nodeid, seconds) of tests whose call phase exceeded settings.MAX_TEST_DURATION_MS
+_slow_tests = []
 
-ollama_service = get_ollama_service()
+# ------------------------------------------------------------------------------
+# Function: _svc
+# ------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _svc():
+    """
+    Lazily import and return the OllamaAIHealingService singleton.
+    The AI healing module (and its Ollama client) is only loaded the first time
+    a failure needs it, so collection and passing runs never pay for it.
+
+    Returns:
+        OllamaAIHealingService: The shared AI healing service instance.
+    """
+    from utils.ai_healing import get_ollama_service
+    return get_ollama_service()
+
+# ------------------------------------------------------------------------------
+# Function: _read_test_source
+# ------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=64)
+def _read_test_source(path):
+    """
+    Read and cache the source of a test file for the AI healing prompt.
+    Cached per path so retries of a flaky test do not re-read the same file.
+
+    Args:
+        path (str): Path to the test module.
+
+    Returns:
+        str: File contents, or an empty string if the file could not be read.
+    """
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except Exception as e:
+        print(f"Warning: Could not read test file: {e}")
+        return ""
+
+# ------------------------------------------------------------------------------
+# Function: _ai_healing_enabled
+# ------------------------------------------------------------------------------
+
+def _ai_healing_enabled():
+    """
+    Check the AI_HEALING_ENABLED environment variable without constructing the service.
+
+    Returns:
+        bool: True if AI healing is enabled, otherwise False.
+    """
+    return os.getenv("AI_HEALING_ENABLED", "false").lower() == "true"
 
 class ElementNotFoundException(Exception):
     """
@@ -112,161 +159,339 @@ def get_selector(locator):
     Returns:
         str: Selector string or fallback string representation.
     """
-    return getattr(locator, "_selector", repr(locator))
+    try:
+        return locator._selector
+    except AttributeError:
+        return repr(locator)
 
 # ------------------------------------------------------------------------------
-# Function: patched_wait_for
+# Function: _raise_not_found_on_timeout
 # ------------------------------------------------------------------------------
 
-_original_wait_for = Locator.wait_for
-
-async def patched_wait_for(self, state="visible", timeout=None):
+def _raise_not_found_on_timeout(original, message):
     """
-    Monkey-patched version of Locator.wait_for that raises ElementNotFoundException
+    Build a monkey-patched Locator method that raises ElementNotFoundException
     instead of Playwright's TimeoutError when the element is not found within timeout.
 
     Args:
-        state (str): The state to wait for (default: "visible").
-        timeout (int): Timeout in milliseconds.
-
-    Raises:
-        ElementNotFoundException: If the element is not found within the timeout.
+        original (callable): The original Locator coroutine method to wrap.
+        message (callable): Bound str.format of the error message template; may
+            reference {selector}, {state} and {timeout}.
 
     Returns:
-        The result of the original wait_for method if successful.
+        callable: Async wrapper with the same call signature as the original.
     """
-    try:
-        return await _original_wait_for(self, state=state, timeout=timeout)
-    except PlaywrightTimeoutError:
-        selector = get_selector(self)
-        raise ElementNotFoundException(
-            f"Element '{selector}' not found after waiting for state '{state}'"
-        )
+    @functools.wraps(original)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await original(self, *args, **kwargs)
+        except PlaywrightTimeoutError:
+            raise ElementNotFoundException(
+                message(
+                    selector=get_selector(self),
+                    state=kwargs.get("state") or "visible",
+                    timeout=kwargs.get("timeout"),
+                )
+            )
 
-Locator.wait_for = patched_wait_for
+    return wrapper
+
+# Error message templates, bound once so raising only fills in the fields
+_MSG_WAIT_FOR = "Element '{selector}' not found after waiting for state '{state}'".format
+_MSG_CLICK = "Element '{selector}' not found (click timeout after {timeout}ms)".format
+_MSG_FILL = "Element '{selector}' not found (fill timeout after {timeout}ms)".format
+
+Locator.wait_for = _raise_not_found_on_timeout(Locator.wait_for, _MSG_WAIT_FOR)
+Locator.click = _raise_not_found_on_timeout(Locator.click, _MSG_CLICK)
+Locator.fill = _raise_not_found_on_timeout(Locator.fill, _MSG_FILL)
 
 # ------------------------------------------------------------------------------
-# Function: patched_click
+# Hook: pytest_collection_modifyitems
 # ------------------------------------------------------------------------------
 
-_original_click = Locator.click
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on pytest-asyncio's session-scoped event loop.
+    The Playwright driver and browser are bound to the loop they start on, so
+    sharing them across tests requires all tests to run on the same loop (async
+    fixtures default to it via asyncio_default_fixture_loop_scope in pytest.ini).
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+# ------------------------------------------------------------------------------
+# Function: _launch_browser
+# ------------------------------------------------------------------------------
 
-async def patched_click(self, *args, timeout=None, **kwargs):
+async def _launch_browser(playwright):
     """
-    Monkey-patched version of Locator.click that raises ElementNotFoundException
-    instead of Playwright's TimeoutError when the element is not clickable within timeout.
+    Launch (or connect to) the browser based on environment variables or settings
+    configuration. Supports Chromium, Firefox, and WebKit.
+    Uses BrowserStack if BROWSERSTACK_ENABLED=true in environment.
 
     Args:
-        *args: Positional arguments for click.
-        timeout (int): Timeout in milliseconds.
-        **kwargs: Keyword arguments for click.
-
-    Raises:
-        ElementNotFoundException: If the element is not clickable within the timeout.
+        playwright (Playwright): Running Playwright instance.
 
     Returns:
-        The result of the original click method if successful.
+        Browser: The launched Playwright Browser instance.
+
+    Raises:
+        ValueError: If an unsupported browser name is specified.
     """
-    try:
-        return await _original_click(self, *args, timeout=timeout, **kwargs)
-    except PlaywrightTimeoutError:
-        selector = get_selector(self)
-        raise ElementNotFoundException(
-            f"Element '{selector}' not found (click timeout after {timeout}ms)"
+    if is_browserstack_enabled():
+        caps = {
+            "browser": "chrome",
+            "browser_version": "latest",
+            "os": "osx",
+            "os_version": "sonoma",
+            "name": "Playwright Test",
+            "build": "playwright-python-build-1",
+            "browserstack.username": os.getenv("BROWSERSTACK_USERNAME"),
+            "browserstack.accessKey": os.getenv("BROWSERSTACK_ACCESS_KEY"),
+        }
+        ws_endpoint = (
+            f"wss://cdp.browserstack.com/playwright?caps={json.dumps(caps)}"
         )
+        browser = await playwright.chromium.connect(ws_endpoint)
+        print("\n Using BrowserStack cloud browser")
+        return browser
+
+    browser_name = os.getenv("BROWSER", settings.BROWSER).lower()
+    headless = os.getenv("HEADLESS", str(settings.HEADLESS)).lower() == "true"
+    browser_options = settings.get_browser_options()
+    browser_options["headless"] = headless
+    if browser_name == "chromium":
+        browser = await playwright.chromium.launch(**browser_options)
+    elif browser_name == "firefox":
+        browser = await playwright.firefox.launch(**browser_options)
+    elif browser_name == "webkit":
+        browser = await playwright.webkit.launch(**browser_options)
+    else:
+        raise ValueError(f"Unsupported BROWSER value: {browser_name}")
+    print(f"\n Using {browser_name} browser (headless={headless})")
+    return browser
 
-Locator.click = patched_click
+# ------------------------------------------------------------------------------
+# Fixture: _playwright
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="session")
+async def _playwright():
+    """
+    Session-scoped fixture that starts the Playwright driver once for the whole run.
+
+    Yields:
+        Playwright: The running Playwright instance.
+    """
+    playwright = await async_playwright().start()
+    yield playwright
+    await playwright.stop()
 
 # ------------------------------------------------------------------------------
-# Function: patched_fill
+# Fixture: _browser
 # ------------------------------------------------------------------------------
 
-_original_fill = Locator.fill
+@pytest_asyncio.fixture(scope="session")
+async def _browser(_playwright):
+    """
+    Session-scoped fixture that launches the browser once for the whole run.
 
-async def patched_fill(self, *args, timeout=None, **kwargs):
+    Yields:
+        Browser: The shared Playwright Browser instance.
     """
-    Monkey-patched version of Locator.fill that raises ElementNotFoundException
-    instead of Playwright's TimeoutError when the element is not fillable within timeout.
+    browser = await _launch_browser(_playwright)
+    yield browser
+    await browser.close()
 
-    Args:
-        *args: Positional arguments for fill.
-        timeout (int): Timeout in milliseconds.
-        **kwargs: Keyword arguments for fill.
+# ------------------------------------------------------------------------------
+# Fixture: page
+# ------------------------------------------------------------------------------
 
-    Raises:
-        ElementNotFoundException: If the element is not fillable within the timeout.
+@pytest_asyncio.fixture
+async def page(_browser):
+    """
+    Async pytest fixture that provides a fresh page in a new, isolated browser
+    context for each test. The Playwright driver and browser are shared across
+    the session; only the context and page are created per test.
+
+    Yields:
+        Page: An instance of Playwright's Page object for test use.
+    """
+    context = await _browser.new_context()
+    page = await context.new_page()
+    yield page
+    await context.close()
+
+# ------------------------------------------------------------------------------
+# Function: _new_shared_context
+# ------------------------------------------------------------------------------
+
+async def _new_shared_context(browser, har=False):
+    """
+    Create a browser context meant to be shared by several tests' tabs.
+
+    Args:
+        browser (Browser): The session browser.
+        har (bool): If True and settings.HAR_FILE is set, requests to BASE_URL
+            are replayed from (or, with HAR_UPDATE, recorded to) that HAR file.
+            Playwright writes the HAR when the context closes, replacing the
+            file, so only a context that lives for a whole module records one.
 
     Returns:
-        The result of the original fill method if successful.
+        BrowserContext: The new context.
     """
-    try:
-        return await _original_fill(self, *args, timeout=timeout, **kwargs)
-    except PlaywrightTimeoutError:
-        selector = get_selector(self)
-        raise ElementNotFoundException(
-            f"Element '{selector}' not found (fill timeout after {timeout}ms)"
+    context = await browser.new_context()
+    if har and settings.HAR_FILE:
+        # Recording goes to the live site; replay aborts anything missing from
+        # the HAR instead of quietly falling back to the network
+        await context.route_from_har(
+            settings.HAR_FILE,
+            url=f"{settings.BASE_URL.rstrip('/')}/**",
+            not_found="fallback" if settings.HAR_UPDATE else "abort",
+            update=settings.HAR_UPDATE,
         )
+        if not settings.HAR_UPDATE:
+            context.on("requestfailed", lambda request: print(
+                f"📼 Request failed during HAR replay (not recorded?): {request.method} {request.url}"
+            ))
+    return context
+
+# ------------------------------------------------------------------------------
+# Function: _new_shared_page
+# ------------------------------------------------------------------------------
+
+async def _new_shared_page(context):
+    """
+    Open a tab in a shared context, then close it and clear the context's
+    cookies when the test ends, so a login in one test does not leak into the next.
 
-Locator.fill = patched_fill
+    Args:
+        context (BrowserContext): The shared context.
+
+    Yields:
+        Page: A new page in the shared context.
+    """
+    page = await context.new_page()
+    yield page
+    await page.close()
+    await context.clear_cookies()
 
 # ------------------------------------------------------------------------------
-# Fixture: page
+# Fixture: shared_context
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="class")
+async def shared_context(_browser):
+    """
+    Class-scoped browser context for test classes that only need a fresh tab,
+    not a fresh context. Modules opt in by overriding page with shared_page.
+    Only tests inside a class share it: pytest rebuilds a class-scoped fixture
+    for every plain test function, so modules of plain functions use
+    module_context instead.
+
+    Yields:
+        BrowserContext: A browser context shared by every test in the class.
+    """
+    context = await _new_shared_context(_browser)
+    yield context
+    await context.close()
+
+# ------------------------------------------------------------------------------
+# Fixture: shared_page
 # ------------------------------------------------------------------------------
 
 @pytest_asyncio.fixture
-async def page():
+async def shared_page(shared_context):
     """
-    Async pytest fixture that launches a Playwright browser page based on environment
-    variables or settings configuration. Supports Chromium, Firefox, and WebKit.
-    Uses BrowserStack if BROWSERSTACK=true in environment.
+    A new tab in the class's shared browser context (cookies cleared after).
+    Modules opt in with a page override that returns this fixture.
 
     Yields:
-        Page: An instance of Playwright's Page object for test use.
+        Page: A new page in the shared context.
+    """
+    async for page in _new_shared_page(shared_context):
+        yield page
 
-    Raises:
-        ValueError: If an unsupported browser name is specified.
+# ------------------------------------------------------------------------------
+# Fixture: module_context
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="module")
+async def module_context(_browser):
     """
-    if is_browserstack_enabled():
-        caps = {
-            "browser": "chrome",
-            "browser_version": "latest",
-            "os": "osx",
-            "os_version": "sonoma",
-            "name": "Playwright Test",
-            "build": "playwright-python-build-1",
-            "browserstack.username": os.getenv("BROWSERSTACK_USERNAME"),
-            "browserstack.accessKey": os.getenv("BROWSERSTACK_ACCESS_KEY"),
-        }
-        ws_endpoint = (
-            f"wss://cdp.browserstack.com/playwright?caps={json.dumps(caps)}"
-        )
-        async with async_playwright() as p:
-            browser = await p.chromium.connect(ws_endpoint)
-            context = await browser.new_context()
-            page = await context.new_page()
-            print("\n Using BrowserStack cloud browser")
-            yield page
-            await browser.close()
-    else:
-        # ...existing local browser logic...
-        async with async_playwright() as p:
-            browser_name = os.getenv("BROWSER", settings.BROWSER).lower()
-            headless = os.getenv("HEADLESS", str(settings.HEADLESS)).lower() == "true"
-            browser_options = settings.get_browser_options()
-            browser_options["headless"] = headless
-            if browser_name == "chromium":
-                browser = await p.chromium.launch(**browser_options)
-            elif browser_name == "firefox":
-                browser = await p.firefox.launch(**browser_options)
-            elif browser_name == "webkit":
-                browser = await p.webkit.launch(**browser_options)
-            else:
-                raise ValueError(f"Unsupported BROWSER value: {browser_name}")
-            context = await browser.new_context()
-            page = await context.new_page()
-            print(f"\n Using {browser_name} browser (headless={headless})")
-            yield page
-            await browser.close()
+    Module-scoped browser context for modules of plain test functions that only
+    need a fresh tab, not a fresh context: the whole module pays for one context.
+    This is the context settings.HAR_FILE applies to, so a recording run
+    captures the whole module's traffic in one HAR.
+
+    Yields:
+        BrowserContext: A browser context shared by every test in the module.
+    """
+    context = await _new_shared_context(_browser, har=True)
+    yield context
+    await context.close()
+
+# ------------------------------------------------------------------------------
+# Fixture: module_page
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def module_page(module_context):
+    """
+    A new tab in the module's shared browser context (cookies cleared after).
+    Modules opt in with a page override that returns this fixture.
+
+    Yields:
+        Page: A new page in the module's shared context.
+    """
+    async for page in _new_shared_page(module_context):
+        yield page
+
+# ------------------------------------------------------------------------------
+# Fixture: _auth_state
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="session")
+async def _auth_state(_browser):
+    """
+    Session-scoped fixture that logs in with the demo user once, in a throwaway
+    context, and keeps the resulting cookies and storage.
+
+    Returns:
+        dict: Playwright storage state of an authenticated session.
+    """
+    from pages.login_page import LoginPage
+
+    context = await _browser.new_context()
+    try:
+        login_page = LoginPage(await context.new_page())
+        await login_page.navigate()
+        await login_page.login_with_demo_user()
+        if not await login_page.is_login_successful():
+            pytest.fail("Demo user login failed; cannot build the authenticated session state")
+        return await login_page.export_storage_state()
+    finally:
+        await context.close()
+
+# ------------------------------------------------------------------------------
+# Fixture: authenticated_page
+# ------------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def authenticated_page(_browser, _auth_state):
+    """
+    Like page, but the new context starts from the session's logged-in storage
+    state, so tests that need the secure area skip the login form entirely.
+
+    Yields:
+        Page: A page in an already authenticated browser context.
+    """
+    context = await _browser.new_context(storage_state=_auth_state)
+    page = await context.new_page()
+    yield page
+    await context.close()
 
 # ------------------------------------------------------------------------------
 # Hook: pytest_runtest_makereport
@@ -281,25 +506,30 @@ def pytest_runtest_makereport(item, call):
 
     NO DECORATORS NEEDED - this applies to ALL tests automatically!
     """
+    # Skip all AI healing logic if disabled, before doing any per-test work
+    if not _ai_healing_enabled():
+        yield
+        return
+
     outcome = yield
     rep = outcome.get_result()
 
-    # Skip all AI healing logic if disabled
-    if not ollama_service.enabled:
-        return
-
     debug_print(f"DEBUG: rep.when={rep.when}, rep.failed={rep.failed}, item={item.nodeid}")
 
     setattr(item, "rep_" + rep.when, rep)
 
     if rep.when == "call" and rep.failed:
+        import allure
+        from utils.ai_healing import find_page_object, ensure_ollama_ready
+        ollama_service = _svc()
+
         test_key = item.nodeid
         max_reruns = item.config.getoption("reruns") or 0
 
-        # Increment fail count in a thread-safe way
-        with _ai_healing_lock:
-            _ai_healing_fail_counts[test_key] += 1
-            fail_count = _ai_healing_fail_counts[test_key]
+        # Track the fail count on the item itself; reruns reuse the same item and
+        # each item's hooks run serially, so no shared dict or lock is needed
+        fail_count = getattr(item, "_ai_fail_count", 0) + 1
+        item._ai_fail_count = fail_count
 
         debug_print(f"DEBUG: {test_key} fail_count={fail_count} (max_reruns={max_reruns})")
 
@@ -307,7 +537,9 @@ def pytest_runtest_makereport(item, call):
         page = find_page_object(item)
         error_message = str(call.excinfo.value) if call.excinfo else "Unknown error"
 
-        # Use async capture_failure_context for full context (including DOM)
+        # Use async capture_failure_context for full context (including DOM).
+        # This must run on the test's own loop, which owns the Playwright page.
+        screenshot_path = None
         if page:
             try:
                 context, screenshot_path = asyncio.get_event_loop().run_until_complete(
@@ -335,18 +567,10 @@ def pytest_runtest_makereport(item, call):
                 "dom": "DOM not available: No page object found",
             }
 
-        # Try to get the original test code
-        original_test_code = ""
-        try:
-            test_file = item.fspath
-            with open(test_file, 'r') as f:
-                original_test_code = f.read()
-        except Exception as e:
-            print(f"Warning: Could not read test file: {e}")
-
-        # Store context for later AI healing
-        if not hasattr(ollama_service, '_pending_contexts'):
-            ollama_service._pending_contexts = {}
+        # Get the original test code (read once per test file, shared across reruns)
+        original_test_code = _read_test_source(str(item.fspath))
+
+        # Store context for later AI healing, keyed by node id
         ollama_service._pending_contexts[test_key] = {
             "test_name": item.name,
             "context": context,
@@ -356,55 +580,87 @@ def pytest_runtest_makereport(item, call):
 
         # This duplicates code in screenshot_decorator, but only runs if AI healing is on
         if screenshot_path and os.path.exists(screenshot_path):
-            with open(screenshot_path, "rb") as image_file:
-                allure.attach(
-                    image_file.read(),
-                    name=f"AI Healing Screenshot: {item.name}",
-                    attachment_type=allure.attachment_type.PNG
-        )
+            allure.attach.file(
+                str(screenshot_path),
+                name=f"AI Healing Screenshot: {item.name}",
+                attachment_type=allure.attachment_type.PNG
+            )
 
         # Only trigger AI healing on the final failure
         if fail_count > max_reruns:
             print(f"\n🧠 Final failure detected for {item.name}, triggering AI healing")
-            if hasattr(ollama_service, '_pending_contexts'):
-                context_data = ollama_service._pending_contexts.get(test_key)
-                if not context_data:
-                    context_data = ollama_service._pending_contexts.get(item.name)
-                if context_data and ollama_service.enabled:
-                    if not ensure_ollama_ready():
-                        print("🧠 AI healing skipped - Ollama service or model unavailable")
-                        return
-                    try:
-                        ai_response = ollama_service.call_ollama_healing(
-                            context_data["context"],
-                            context_data["original_test_code"],
-                            context_data["screenshot_path"]
-                        )
-                        if ai_response:
-                            asyncio.run(ollama_service.generate_healing_report(
+            context_data = ollama_service._pending_contexts.get(test_key)
+            if context_data and ollama_service.enabled:
+                if not ensure_ollama_ready():
+                    print("🧠 AI healing skipped - Ollama service or model unavailable")
+                    return
+                try:
+                    ai_response = ollama_service.call_ollama_healing(
+                        context_data["context"],
+                        context_data["original_test_code"],
+                        context_data["screenshot_path"]
+                    )
+                    if ai_response:
+                        # Written before the next test starts, on the same loop as
+                        # the context capture above, so its output stays with this test
+                        asyncio.get_event_loop().run_until_complete(
+                            ollama_service.generate_healing_report(
                                 context_data["test_name"],
                                 ai_response,
                                 context_data["context"]
-                            ))
-                        else:
-                            print(f"🧠 Ollama analysis failed for {item.name}")
-                        # Clean up
-                        if test_key in ollama_service._pending_contexts:
-                            del ollama_service._pending_contexts[test_key]
-                        if item.name in ollama_service._pending_contexts:
-                            del ollama_service._pending_contexts[item.name]
-                    except Exception as e:
-                        print(f"🧠 AI healing hook failed: {e}")
-                else:
-                    if not context_data:
-                        print(f"🧠 No context data found for {item.name}")
-                    if not ollama_service.enabled:
-                        print(f"🧠 AI healing disabled for {item.name}")
+                            )
+                        )
+                    else:
+                        print(f"🧠 Ollama analysis failed for {item.name}")
+                    # Clean up
+                    ollama_service._pending_contexts.pop(test_key, None)
+                except Exception as e:
+                    print(f"🧠 AI healing hook failed: {e}")
             else:
-                print(f"🧠 No pending contexts found")
-            # Clean up fail count
-            with _ai_healing_lock:
-                if test_key in _ai_healing_fail_counts:
-                    del _ai_healing_fail_counts[test_key]
+                if not context_data:
+                    print(f"🧠 No context data found for {item.name}")
+                if not ollama_service.enabled:
+                    print(f"🧠 AI healing disabled for {item.name}")
         else:
             print(f"🔄 Test {item.name} will be retried (attempt {fail_count}), skipping AI healing")
+
+# ------------------------------------------------------------------------------
+# Hook: pytest_runtest_logreport
+# ------------------------------------------------------------------------------
+
+def pytest_runtest_logreport(report):
+    """
+    Hook that records tests whose call phase ran past settings.MAX_TEST_DURATION_MS.
+    Under xdist the controller receives every worker's reports here as well.
+    """
+    limit_ms = settings.MAX_TEST_DURATION_MS
+    if limit_ms and report.when == "call" and report.duration * 1000 > limit_ms:
+        _slow_tests.append((report.nodeid, report.duration))
+
+# ------------------------------------------------------------------------------
+# Hook: pytest_terminal_summary
+# ------------------------------------------------------------------------------
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Hook that lists the tests that exceeded the duration budget, if any.
+    """
+    if not _slow_tests:
+        return
+    terminalreporter.section(
+        f"tests over MAX_TEST_DURATION_MS={settings.MAX_TEST_DURATION_MS}", red=True
+    )
+    for nodeid, duration in sorted(_slow_tests, key=lambda t: t[1], reverse=True):
+        terminalreporter.write_line(f"{duration:.2f}s {nodeid}")
+
+# ------------------------------------------------------------------------------
+# Hook: pytest_sessionfinish
+# ------------------------------------------------------------------------------
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Hook that runs once after the whole test session.
+    Fails an otherwise passing run if any test exceeded the duration budget.
+    """
+    if _slow_tests and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
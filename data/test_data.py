@@ -4,11 +4,46 @@ Test data for negative testing scenarios including invalid credentials,
 malicious inputs, and edge cases for form validation.
 Updated for The Internet test site (username/password instead of email/password).
 """
+import functools
+import itertools
+import random
+import re
+from types import MappingProxyType
+
+__all__ = (
+    "INVALID_USERS",
+    "EXPECTED_MESSAGES",
+    "TEST_URLS",
+    "INVALID_PASSWORDS",
+    "INVALID_USERNAMES",
+    "SQL_INJECTION_PAYLOADS",
+    "XSS_PAYLOADS",
+    "COMMAND_INJECTION_PAYLOADS",
+    "detect_injection",
+    "PATH_TRAVERSAL_PAYLOADS",
+    "INVALID_NAMES",
+    "BOUNDARY_VALUES",
+    "ATTACK_STRINGS",
+    "INVALID_EMAILS",
+    "scan_for_attacks",
+    "contains_attack",
+    "get_random_invalid_email",
+    "get_random_sql_payload",
+    "get_random_xss_payload",
+    "set_payload_seed",
+)
+
+# Dedicated, fixed-seed generator for the payload helpers: their picks are
+# reproducible and do not consume or depend on the global random state
+_PAYLOAD_RNG = random.Random(0xC0FFEE)
+_choice = _PAYLOAD_RNG.choice
 
 # =====================================
 # Invalid User Credentials for Testing
 # =====================================
-INVALID_USERS = {
+# Only the outer mapping is read-only; the records stay plain dicts so they
+# can still be JSON-serialized or passed to APIs expecting a dict
+INVALID_USERS = MappingProxyType({
     "invalid_username": {
         "username": "invaliduser",
         "password": "SuperSecretPassword!"
@@ -33,12 +68,12 @@ INVALID_USERS = {
         "username": "nonexistentuser123",
         "password": "anypassword"
     }
-}
+})
 
 # =====================================
 # Expected Error Messages
 # =====================================
-EXPECTED_MESSAGES = {
+EXPECTED_MESSAGES = MappingProxyType({
     "invalid_username": "Your username is invalid!",
     "invalid_password": "Your password is invalid!",
     "login_success": "You logged into a secure area!",
@@ -46,24 +81,24 @@ EXPECTED_MESSAGES = {
     "login_page_title": "Login Page",
     "secure_area_title": "Secure Area",
     "base": "https://the-internet.herokuapp.com"
-}
+})
 
 # =====================================
 # Test URLs for The Internet Test Site  
 # =====================================
-TEST_URLS = {
+TEST_URLS = MappingProxyType({
     "base": "https://the-internet.herokuapp.com",
     "base_url": "https://the-internet.herokuapp.com",
     "login_page": "https://the-internet.herokuapp.com/login",
     "secure_page": "https://the-internet.herokuapp.com/secure",
     "home_page": "https://the-internet.herokuapp.com",
     "logout_url": "https://the-internet.herokuapp.com/logout"
-}
+})
 
 # =====================================
 # Invalid Passwords
 # =====================================
-INVALID_PASSWORDS = {
+INVALID_PASSWORDS = MappingProxyType({
     "empty": "",
     "too_short": "123",
     "no_uppercase": "password123!",
@@ -71,7 +106,7 @@ INVALID_PASSWORDS = {
     "no_numbers": "Password!",
     "no_special": "Password123",
     "only_spaces": "   ",
-    "common_weak": [
+    "common_weak": (
         "password",
         "123456",
         "qwerty",
@@ -79,18 +114,18 @@ INVALID_PASSWORDS = {
         "admin",
         "welcome",
         "monkey",
-        "dragon"
-    ],
+        "dragon",
+    ),
     "sequential": "123456789",
     "keyboard_pattern": "qwertyuiop",
     "repeated_chars": "aaaaaaa",
     "too_long": "a" * 129,  # Assuming 128 char limit
-}
+})
 
 # =====================================
 # Invalid Usernames (adapted from emails)
 # =====================================
-INVALID_USERNAMES = {
+INVALID_USERNAMES = MappingProxyType({
     "empty": "",
     "with_spaces": "user name",
     "special_chars": "user<>name",
@@ -101,12 +136,12 @@ INVALID_USERNAMES = {
     "too_long": "a" * 250,
     "unicode": "用户@domain.com",
     "sql_injection": "user'; DROP TABLE users;--@domain.com",
-}
+})
 
 # =====================================
 # SQL Injection Payloads
 # =====================================
-SQL_INJECTION_PAYLOADS = {
+SQL_INJECTION_PAYLOADS = MappingProxyType({
     "basic_or": "' OR '1'='1",
     "comment_bypass": "admin'--",
     "union_select": "' UNION SELECT * FROM users--",
@@ -115,12 +150,13 @@ SQL_INJECTION_PAYLOADS = {
     "time_based": "'; WAITFOR DELAY '00:00:05'--",
     "error_based": "' AND (SELECT COUNT(*) FROM information_schema.tables)>0--",
     "stacked_queries": "'; INSERT INTO users VALUES('hacker','pass');--",
-}
+})
+_SQL_VALUES = tuple(SQL_INJECTION_PAYLOADS.values())
 
 # =====================================
 # XSS Payloads
 # =====================================
-XSS_PAYLOADS = {
+XSS_PAYLOADS = MappingProxyType({
     "basic_script": "<script>alert('xss')</script>",
     "img_onerror": "<img src=x onerror=alert('xss')>",
     "svg_onload": "<svg onload=alert('xss')>",
@@ -129,12 +165,13 @@ XSS_PAYLOADS = {
     "encoded": "%3Cscript%3Ealert('xss')%3C/script%3E",
     "iframe": "<iframe src=javascript:alert('xss')></iframe>",
     "body_onload": "<body onload=alert('xss')>",
-}
+})
+_XSS_VALUES = tuple(XSS_PAYLOADS.values())
 
 # =====================================
 # Command Injection Payloads
 # =====================================
-COMMAND_INJECTION_PAYLOADS = {
+COMMAND_INJECTION_PAYLOADS = MappingProxyType({
     "basic": "; ls",
     "pipe": "| whoami",
     "background": "& ping google.com",
@@ -143,24 +180,47 @@ COMMAND_INJECTION_PAYLOADS = {
     "backticks": "`whoami`",
     "dollar_paren": "$(whoami)",
     "newline": "\nls -la",
-}
+})
+
+@functools.lru_cache(maxsize=None)
+def _injection_re():
+    """
+    One case-insensitive pattern over every XSS, SQL and command injection payload,
+    with a named group per payload mapped back to its (family, dict key). Built on
+    first use so importing the test data never pays for compiling it.
+    """
+    payloads = sorted(
+        itertools.chain(
+            (("xss", key, value) for key, value in XSS_PAYLOADS.items()),
+            (("sql", key, value) for key, value in SQL_INJECTION_PAYLOADS.items()),
+            (("command", key, value) for key, value in COMMAND_INJECTION_PAYLOADS.items()),
+        ),
+        key=lambda item: len(item[2]),
+        reverse=True,
+    )
+    group_to_key = {f"p{i}": (family, key) for i, (family, key, _) in enumerate(payloads)}
+    pattern = re.compile(
+        "|".join(f"(?P<p{i}>{re.escape(value)})" for i, (_, _, value) in enumerate(payloads)),
+        re.IGNORECASE,
+    )
+    return pattern, group_to_key
 
 # =====================================
 # Path Traversal Payloads
 # =====================================
-PATH_TRAVERSAL_PAYLOADS = {
+PATH_TRAVERSAL_PAYLOADS = MappingProxyType({
     "basic": "../../../etc/passwd",
     "windows": "..\\..\\..\\windows\\system32\\drivers\\etc\\hosts",
     "encoded": "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
     "double_encoded": "%252e%252e%252f",
     "unicode": "..%c0%af..%c0%af..%c0%afetc%c0%afpasswd",
     "null_byte": "../../../etc/passwd%00",
-}
+})
 
 # =====================================
 # Invalid Names/Text Fields
 # =====================================
-INVALID_NAMES = {
+INVALID_NAMES = MappingProxyType({
     "empty": "",
     "only_spaces": "   ",
     "numbers_only": "12345",
@@ -172,12 +232,12 @@ INVALID_NAMES = {
     "emoji": "👤🔥💯",
     "newlines": "First\nName",
     "tabs": "First\tName",
-}
+})
 
 # =====================================
 # Boundary Values
 # =====================================
-BOUNDARY_VALUES = {
+BOUNDARY_VALUES = MappingProxyType({
     "max_int": 2147483647,
     "min_int": -2147483648,
     "zero": 0,
@@ -185,12 +245,12 @@ BOUNDARY_VALUES = {
     "float": 3.14159,
     "very_large": 999999999999999999999,
     "scientific": "1e10",
-}
+})
 
 # =====================================
 # Common Attack Strings
 # =====================================
-ATTACK_STRINGS = [
+ATTACK_STRINGS = (
     # XSS
     "<script>alert('xss')</script>",
     "javascript:alert('xss')",
@@ -216,12 +276,24 @@ ATTACK_STRINGS = [
     
     # XML Injection
     "<?xml version='1.0'?><!DOCTYPE root [<!ENTITY test SYSTEM 'file:///etc/passwd'>]><root>&test;</root>",
-]
+)
+
+@functools.lru_cache(maxsize=None)
+def _attack_re():
+    """
+    Single pattern matching any attack string, plus each string's index, built on
+    first use. Longer strings come first so one containing another is reported in full.
+    """
+    index = {attack: i for i, attack in enumerate(ATTACK_STRINGS)}
+    pattern = re.compile("|".join(
+        re.escape(attack) for attack in sorted(ATTACK_STRINGS, key=len, reverse=True)
+    ))
+    return pattern, index
 
 # =====================================
 # Invalid Emails
 # =====================================
-INVALID_EMAILS = {
+INVALID_EMAILS = MappingProxyType({
     "empty": "",
     "no_at_symbol": "invalidemail.com",
     "multiple_at": "user@@domain.com",
@@ -237,22 +309,69 @@ INVALID_EMAILS = {
     "too_long": "a" * 250 + "@domain.com",
     "unicode": "用户@domain.com",
     "sql_injection": "user'; DROP TABLE users;--@domain.com",
-}
+})
+_INVALID_EMAIL_VALUES = tuple(INVALID_EMAILS.values())
 
 # =====================================
 # Helper Functions
 # =====================================
 def get_random_invalid_email():
     """Get a random invalid email for testing."""
-    import random
-    return random.choice(list(INVALID_EMAILS.values()))
+    return _choice(_INVALID_EMAIL_VALUES)
 
 def get_random_sql_payload():
     """Get a random SQL injection payload."""
-    import random
-    return random.choice(list(SQL_INJECTION_PAYLOADS.values()))
+    return _choice(_SQL_VALUES)
 
 def get_random_xss_payload():
     """Get a random XSS payload."""
-    import random
-    return random.choice(list(XSS_PAYLOADS.values()))
\ No newline at end of file
+    return _choice(_XSS_VALUES)
+
+def set_payload_seed(seed):
+    """Reseed the generator behind the get_random_* helpers."""
+    _PAYLOAD_RNG.seed(seed)
+
+def scan_for_attacks(text):
+    """
+    Scan text for any of the ATTACK_STRINGS in a single pass.
+
+    Args:
+        text (str): Response body, input value or other text to scan.
+
+    Yields:
+        tuple: (index into ATTACK_STRINGS, matched attack string) for each
+            non-overlapping match, in the order they appear in the text.
+    """
+    pattern, index = _attack_re()
+    for match in pattern.finditer(text):
+        attack = match.group()
+        yield index[attack], attack
+
+def detect_injection(text):
+    """
+    Check text for any XSS, SQL injection or command injection payload.
+
+    Args:
+        text (str): Response body, input value or other text to check.
+
+    Returns:
+        tuple or None: (family, key) of the first payload found, where family is
+            "xss", "sql" or "command" (e.g. ("xss", "basic_script")), or None if
+            the text contains none of them. Longer payloads win over ones they contain.
+    """
+    pattern, group_to_key = _injection_re()
+    match = pattern.search(text)
+    return group_to_key[match.lastgroup] if match else None
+
+def contains_attack(text):
+    """
+    Quick yes/no check for whether text contains any of the ATTACK_STRINGS.
+    Stops at the first match, so clean text (the common case) costs one pass.
+
+    Args:
+        text (str): Response body, input value or other text to check.
+
+    Returns:
+        bool: True if any attack string occurs in the text.
+    """
+    return _attack_re()[0].search(text) is not None
@@ -28,10 +28,10 @@ Usage Example:
         assert await app.secure_page.is_on_secure_page()
 
 Conventions:
-    - All page objects are instantiated in __init__ for immediate availability
-    - Page objects are stored as instance attributes for easy access
+    - Page objects are created on first access and then cached as instance
+      attributes, so a test only builds the page objects it uses
     - No async operations are performed in __init__ to avoid fixture issues
-    - New page objects should be added as attributes following the same pattern
+    - New page objects should be added to _PAGE_CLASSES following the same pattern
 
 Author: PMAC
 Site: The Internet (https://the-internet.herokuapp.com)
@@ -41,8 +41,22 @@ from pages.login_page import LoginPage
 from pages.secure_page import SecurePage
 
 
+# Attribute name -> page object class, built lazily by App.__getattr__
+_PAGE_CLASSES = {
+    "login_page": LoginPage,
+    "secure_page": SecurePage,
+}
+
+
 class App:
     def __init__(self, page):
         self.page = page
-        self.login_page = LoginPage(page)
-        self.secure_page = SecurePage(page)
+
+    def __getattr__(self, name):
+        """Build a page object on first access and cache it on the instance."""
+        cls = _PAGE_CLASSES.get(name)
+        if cls is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        page_object = cls(self.page)
+        setattr(self, name, page_object)
+        return page_object
@@ -30,26 +30,68 @@ Conventions:
     - Common functionality is implemented here to avoid code duplication
     - Page-specific logic should be implemented in individual page classes
     - All methods are async to maintain Playwright compatibility
+    - Locators on the login/logout path use ID or attribute CSS selectors
+      (e.g. "#username", "a[href='/logout']"), not get_by_role, which has to
+      scan every element and compute accessible names on each resolution
 
 Author: PMAC
 Date: [2025-07-27]
 ===============================================================================
 """
-from playwright.async_api import Page
+import functools
+import re
+from playwright.async_api import Page, expect
+from config.settings import settings
+from utils.locator_cache import healed_selector
+
+
+@functools.lru_cache(maxsize=256)
+def _contains_re(text: str) -> re.Pattern:
+    # Compiled once per distinct text; escaped so it is matched literally
+    return re.compile(f".*{re.escape(text)}.*")
+
+
+# textContent of the first match if it is visible (Playwright's definition: a
+# non-empty box and not visibility:hidden), otherwise "" - also when nothing matches
+_VISIBLE_TEXT_JS = """els => {
+    const el = els[0];
+    if (!el) return "";
+    const box = el.getBoundingClientRect();
+    if (!box.width || !box.height || getComputedStyle(el).visibility === "hidden") return "";
+    return el.textContent || "";
+}"""
 
 
 class BasePage:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("page", "_tmo")
+
     def __init__(self, page: Page):
         self.page = page
+        # Resolved once per page object so each call passes a plain int
+        self._tmo = int(settings.TIMEOUT)
+
+    @property
+    def timeout(self) -> int:
+        return self._tmo
+
+    # Selector to use for one written in a page object: its AI-healed replacement
+    # for this page's URL if USE_HEALED_SELECTORS is on, otherwise the selector itself
+    def resolve(self, selector: str) -> str:
+        return healed_selector(selector, getattr(self, "url", ""))
+
+    # Locator for a selector, resolved as above
+    def locate(self, selector: str):
+        return self.page.locator(self.resolve(selector))
 
     # =====================================
     # Basic Navigation Methods
     # =====================================
     async def goto(self, url: str):
-        await self.page.goto(url)
+        await self.page.goto(url, timeout=self._tmo)
 
     async def navigate_to(self, url: str):
-        await self.page.goto(url)
+        await self.page.goto(url, timeout=self._tmo)
 
     async def wait_for_load_state(self, state="load"):
         await self.page.wait_for_load_state(state)
@@ -63,9 +105,15 @@ class BasePage:
     async def get_url(self) -> str:
         return self.page.url
 
+    # Web-first assertion: retried until the URL contains text or the timeout expires
+    async def expect_url_contains(self, text: str):
+        await expect(self.page).to_have_url(_contains_re(text), timeout=self._tmo)
+
     # =====================================
     # Element Interaction Methods
     # =====================================
+    # fill(), click() and inner_text() already wait for the element themselves,
+    # so no visibility wait is done up front
     async def fill_text(self, locator, text: str):
         await locator.fill(text)
 
@@ -73,9 +121,18 @@ class BasePage:
         await locator.click()
 
     async def get_text(self, locator) -> str:
+        return await locator.inner_text()
+
+    # Raw textContent, including text of hidden elements
+    async def get_text_content(self, locator) -> str:
         text = await locator.text_content()
         return text or ""
 
+    # Text of an element that may be absent, in one round-trip: evaluate_all()
+    # does not wait, so an absent or hidden element gives "" straight away
+    async def get_text_if_present(self, locator) -> str:
+        return await locator.evaluate_all(_VISIBLE_TEXT_JS)
+
     # =====================================
     # Element State Methods
     # =====================================
@@ -86,4 +143,4 @@ class BasePage:
             return False
 
     async def wait_for_element(self, locator):
-        await locator.wait_for(state="visible")
+        await locator.wait_for(state="visible", timeout=self._tmo)
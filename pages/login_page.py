@@ -10,7 +10,7 @@ Features:
     ✓ Locators for username and password input fields
     ✓ Methods for entering credentials and submitting login form
     ✓ Error message handling and verification
-    ✓ Usage of @property for clean locator access
+    ✓ Locators created once per page object for clean, cheap access
     ✓ Async methods for Playwright compatibility
 
 Usage Example:
@@ -28,7 +28,7 @@ Usage Example:
         assert await login_page.is_login_successful()
 
 Conventions:
-    - All locators are defined as @property methods for clarity and reusability
+    - All locators are created once in __init__ and reused as instance attributes
     - All Playwright actions and queries are implemented as async methods
     - Error messages are handled with specific methods for different scenarios
     - Navigation methods are provided for direct page access
@@ -37,13 +37,49 @@ Author: PMAC
 Site: The Internet (https://the-internet.herokuapp.com)
 ===============================================================================
 """
+import asyncio
 from .base_page import BasePage
 
+# Form selectors, shared by the locators and the single round-trip scripts below
+_USERNAME_SEL = "#username"
+_PASSWORD_SEL = "#password"
+_SUBMIT_SEL = "button[type='submit']"
+
+# Fills both credential fields and submits the form in one browser round-trip;
+# takes the (resolved) field selectors so it targets the same elements as the locators
+_FAST_LOGIN_JS = """([userSel, passSel, submitSel, username, password]) => {
+    document.querySelector(userSel).value = username;
+    document.querySelector(passSel).value = password;
+    document.querySelector(submitSel).click();
+}"""
+
+# Reads both credential field values in one browser round-trip
+_FORM_VALUES_JS = """([userSel, passSel]) => [
+    document.querySelector(userSel).value,
+    document.querySelector(passSel).value,
+]"""
+
 
 class LoginPage(BasePage):
+    # Fixed page URL, shared by every instance rather than rebuilt per __init__
+    url = "https://the-internet.herokuapp.com/login"
+
+    __slots__ = (
+        "username_field", "password_field", "login_button",
+        "success_message", "error_message", "flash_message", "page_heading",
+    )
+
     def __init__(self, page):
         super().__init__(page)
-        self.url = "https://the-internet.herokuapp.com/login"
+
+        # Locators are built once here and reused, rather than per access
+        self.username_field = self.locate(_USERNAME_SEL)
+        self.password_field = self.locate(_PASSWORD_SEL)
+        self.login_button = self.locate(_SUBMIT_SEL)
+        self.success_message = self.locate(".flash.success")
+        self.error_message = self.locate(".flash.error")
+        self.flash_message = self.locate("#flash")
+        self.page_heading = self.locate("h2")
 
     # =====================================
     # Navigation Methods
@@ -59,11 +95,6 @@ class LoginPage(BasePage):
     # =====================================
     # Username Field
     # =====================================
-    @property
-    def username_field(self):
-        """Locator for the username input field."""
-        return self.page.locator("#username")
-
     async def enter_username(self, username: str):
         """Enter username into the username field."""
         await self.username_field.fill(username)
@@ -75,11 +106,6 @@ class LoginPage(BasePage):
     # =====================================
     # Password Field
     # =====================================
-    @property
-    def password_field(self):
-        """Locator for the password input field."""
-        return self.page.locator("#password")
-
     async def enter_password(self, password: str):
         """Enter password into the password field."""
         await self.password_field.fill(password)
@@ -88,14 +114,16 @@ class LoginPage(BasePage):
         """Get the current value from the password field."""
         return await self.password_field.input_value()
 
+    async def get_form_values(self) -> tuple[str, str]:
+        """Get the username and password field values in a single round-trip."""
+        username, password = await self.page.evaluate(
+            _FORM_VALUES_JS, [self.resolve(_USERNAME_SEL), self.resolve(_PASSWORD_SEL)]
+        )
+        return username, password
+
     # =====================================
     # Login Button
     # =====================================
-    @property
-    def login_button(self):
-        """Locator for the login submit button."""
-        return self.page.locator("button[type='submit']")
-
     async def click_login(self):
         """Click the login button to submit the form."""
         await self.login_button.click()
@@ -103,15 +131,32 @@ class LoginPage(BasePage):
     # =====================================
     # Convenience Methods
     # =====================================
-    async def login_with_credentials(self, username: str, password: str):
-        """Complete login flow with username and password."""
-        await self.enter_username(username)
-        await self.enter_password(password)
-        await self.click_login()
-
-    async def login(self, username: str, password: str):
+    async def login_with_credentials(self, username: str, password: str, fast_login: bool = False):
+        """
+        Complete login flow with username and password.
+        With fast_login=True both fields are set and the form submitted in a single
+        page.evaluate round-trip instead of three separate actions; use it only where
+        the test does not care about the individual fill/click steps.
+        """
+        if not fast_login:
+            await self.enter_username(username)
+            await self.enter_password(password)
+        # Both outcomes post the form and load a new document; wait for that
+        # document itself, since a retried login still shows the old #flash
+        async with self.page.expect_navigation(
+            wait_until="domcontentloaded", timeout=self.timeout
+        ):
+            if fast_login:
+                await self.page.evaluate(_FAST_LOGIN_JS, [
+                    self.resolve(_USERNAME_SEL), self.resolve(_PASSWORD_SEL),
+                    self.resolve(_SUBMIT_SEL), username, password,
+                ])
+            else:
+                await self.click_login()
+
+    async def login(self, username: str, password: str, fast_login: bool = False):
         """Alias for login_with_credentials for backward compatibility."""
-        await self.login_with_credentials(username, password)
+        await self.login_with_credentials(username, password, fast_login)
 
     async def login_with_demo_user(self):
         """Login with the demo user credentials."""
@@ -119,12 +164,22 @@ class LoginPage(BasePage):
 
     async def get_flash_message(self) -> str:
         """Convenience method - returns flash message text (success or error)."""
-        # Try success message first, then error message
-        if await self.is_login_successful():
-            return await self.get_success_message_text()
-        elif await self.has_error_message():
-            return await self.get_error_message_text()
-        return ""
+        # Check both messages concurrently; success wins if both are shown
+        success_visible, error_visible = await asyncio.gather(
+            self.success_message.is_visible(),
+            self.error_message.is_visible(),
+        )
+        if success_visible:
+            text = await self.success_message.text_content()
+        elif error_visible:
+            text = await self.error_message.text_content()
+        else:
+            return ""
+        return text.strip() if text else ""
+
+    async def export_storage_state(self) -> dict:
+        """Return the context's cookies and local storage, e.g. after a successful login."""
+        return await self.page.context.storage_state()
 
     async def clear_username(self):
         """Clear the username field."""
@@ -140,46 +195,30 @@ class LoginPage(BasePage):
         Uses incorrect locator to trigger healing mechanism.
         """
         # Incorrect locator - should be #password but using wrong selector
-        wrong_password_field = self.page.locator("#passwordx")
+        wrong_password_field = self.locate("#passwordx")
         await wrong_password_field.fill(password)
 
     # =====================================
     # Success Verification
     # =====================================
-    @property
-    def success_message(self):
-        """Locator for the success flash message."""
-        return self.page.locator(".flash.success")
-
     async def is_login_successful(self) -> bool:
         """Check if login was successful by looking for success message."""
         return await self.success_message.is_visible()
 
     async def get_success_message_text(self) -> str:
         """Get the text of the success message."""
-        if await self.success_message.is_visible():
-            text = await self.success_message.text_content()
-            return text.strip() if text else ""
-        return ""
+        return (await self.get_text_if_present(self.success_message)).strip()
 
     # =====================================
     # Error Message Handling
     # =====================================
-    @property
-    def error_message(self):
-        """Locator for the error flash message."""
-        return self.page.locator(".flash.error")
-
     async def has_error_message(self) -> bool:
         """Check if an error message is displayed."""
         return await self.error_message.is_visible()
 
     async def get_error_message_text(self) -> str:
         """Get the text of the error message."""
-        if await self.error_message.is_visible():
-            text = await self.error_message.text_content()
-            return text.strip() if text else ""
-        return ""
+        return (await self.get_text_if_present(self.error_message)).strip()
 
     # =====================================
     # Page State Verification
@@ -191,7 +230,4 @@ class LoginPage(BasePage):
 
     async def get_page_heading(self) -> str:
         """Get the main heading text on the login page."""
-        heading = self.page.locator("h2")
-        if await heading.is_visible():
-            return await heading.text_content() or ""
-        return ""
+        return await self.get_text_if_present(self.page_heading)
@@ -27,7 +27,7 @@ Usage Example:
         await secure_page.logout()
 
 Conventions:
-    - All locators are defined as @property methods for clarity and reusability
+    - All locators are created once in __init__ and reused as instance attributes
     - All Playwright actions and queries are implemented as async methods
     - Page state verification methods for robust test assertions
     - Clear separation between actions and verifications
@@ -36,13 +36,29 @@ Author: PMAC
 Site: The Internet (https://the-internet.herokuapp.com)
 ===============================================================================
 """
+import asyncio
+import re
 from .base_page import BasePage
 
+# Matches the /secure path segment itself, not e.g. /secure-file-download
+_SECURE_URL_RE = re.compile(r"/secure(?:$|[/?#])")
+
 
 class SecurePage(BasePage):
+    # Fixed page URL, shared by every instance rather than rebuilt per __init__
+    url = "https://the-internet.herokuapp.com/secure"
+
+    __slots__ = ("page_heading", "flash_message", "success_message", "logout_link", "subheader")
+
     def __init__(self, page):
         super().__init__(page)
-        self.url = "https://the-internet.herokuapp.com/secure"
+
+        # Locators are built once here and reused, rather than per access
+        self.page_heading = self.locate("h2")
+        self.flash_message = self.locate("#flash")
+        self.success_message = self.locate(".flash.success")
+        self.logout_link = self.locate("a[href='/logout']")
+        self.subheader = self.locate(".subheader")
 
     # =====================================
     # Navigation Methods
@@ -54,36 +70,16 @@ class SecurePage(BasePage):
     # =====================================
     # Page Heading
     # =====================================
-    @property
-    def page_heading(self):
-        """Locator for the secure area page heading."""
-        return self.page.locator("h2")
-
     async def get_page_heading_text(self) -> str:
         """Get the text of the page heading."""
-        if await self.page_heading.is_visible():
-            return await self.page_heading.text_content() or ""
-        return ""
+        return await self.get_text_if_present(self.page_heading)
 
     # =====================================
     # Flash Messages
     # =====================================
-    @property
-    def flash_message(self):
-        """Locator for flash messages (success/error)."""
-        return self.page.locator("#flash")
-
-    @property
-    def success_message(self):
-        """Locator for success flash message."""
-        return self.page.locator(".flash.success")
-
     async def get_flash_message_text(self) -> str:
         """Get the text of the flash message."""
-        if await self.flash_message.is_visible():
-            text = await self.flash_message.text_content()
-            return text.strip() if text else ""
-        return ""
+        return (await self.get_text_if_present(self.flash_message)).strip()
 
     async def has_success_message(self) -> bool:
         """Check if a success flash message is displayed."""
@@ -99,14 +95,13 @@ class SecurePage(BasePage):
     # =====================================
     # Logout Functionality
     # =====================================
-    @property
-    def logout_link(self):
-        """Locator for the logout link."""
-        return self.page.locator("a[href='/logout']")
-
     async def logout(self):
         """Click the logout link to end the session."""
-        await self.logout_link.click()
+        # Logout redirects back to the login form; wait for that document to load
+        async with self.page.expect_navigation(
+            wait_until="domcontentloaded", timeout=self.timeout
+        ):
+            await self.logout_link.click()
 
     async def is_logout_link_visible(self) -> bool:
         """Check if the logout link is visible on the page."""
@@ -117,16 +112,18 @@ class SecurePage(BasePage):
     # =====================================
     async def is_on_secure_page(self) -> bool:
         """Verify that we are on the secure area page."""
-        current_url = await self.get_url()
-        return "/secure" in current_url
+        # page.url is a local property, so this needs no round-trip to the browser
+        return _SECURE_URL_RE.search(self.page.url) is not None
 
     async def is_authenticated(self) -> bool:
         """
         Verify that the user is authenticated by checking for secure page elements.
         This checks for both the correct URL and the presence of the logout link.
         """
-        is_on_secure = await self.is_on_secure_page()
-        has_logout = await self.is_logout_link_visible()
+        is_on_secure, has_logout = await asyncio.gather(
+            self.is_on_secure_page(),
+            self.is_logout_link_visible(),
+        )
         return is_on_secure and has_logout
 
     # =====================================
@@ -134,7 +131,4 @@ class SecurePage(BasePage):
     # =====================================
     async def get_page_content(self) -> str:
         """Get the main content text of the secure page."""
-        content = self.page.locator(".subheader")
-        if await content.is_visible():
-            return await content.text_content() or ""
-        return ""
+        return await self.get_text_if_present(self.subheader)
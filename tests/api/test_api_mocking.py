@@ -36,214 +36,314 @@ Date: [2025-09-03]
 ===============================================================================
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 import json
-import time
-from pathlib import Path
-from utils.network_mocking import create_mock_data_file, get_mock_template
+from types import MappingProxyType
+from playwright.async_api import expect
+from config.settings import settings
+from utils.network_mocking import NetworkMocker, create_mock_data_file, get_mock_template
+from utils.html_templates import AUTH_TEMPLATE, DO_FETCH_JS, ERROR_TEMPLATE, FETCH_TEMPLATE, load_html
+
+
+# Mocked response bodies, serialized once at import. The mocker sends string
+# bodies as-is, so tests and class-scoped routes never re-encode them.
+NEW_USER_RESPONSE_JSON = json.dumps({
+    "id": 4,
+    "name": "Alice Cooper",
+    "email": "alice@example.com",
+    "active": True,
+    "created_at": "2024-01-15T10:30:00Z"
+})
+UPDATED_USER_JSON = json.dumps({
+    "id": 1,
+    "name": "John Doe Updated",
+    "email": "john.updated@example.com",
+    "active": True,
+    "updated_at": "2024-01-15T11:00:00Z"
+})
+DELETE_MESSAGE_JSON = json.dumps({"message": "User deleted successfully"})
+AUTH_USER_RESPONSE_JSON = json.dumps(
+    {"user": {"id": 1, "name": "Authenticated User", "role": "admin"}}
+)
+UNAUTH_RESPONSE_JSON = json.dumps({"error": "Unauthorized"})
+USERS_PAGE1_JSON = json.dumps({
+    "users": [
+        {"id": 1, "name": "User 1"},
+        {"id": 2, "name": "User 2"},
+        {"id": 3, "name": "User 3"}
+    ],
+    "page": 1,
+    "per_page": 3,
+    "total": 7,
+    "total_pages": 3,
+    "has_next": True
+})
+USERS_PAGE2_JSON = json.dumps({
+    "users": [
+        {"id": 4, "name": "User 4"},
+        {"id": 5, "name": "User 5"},
+        {"id": 6, "name": "User 6"}
+    ],
+    "page": 2,
+    "per_page": 3,
+    "total": 7,
+    "total_pages": 3,
+    "has_next": True
+})
+LOGIN_RESPONSE_JSON = json.dumps({
+    "token": "abc123",
+    "user": {"id": 1, "name": "Test User", "role": "user"}
+})
+PROFILE_RESPONSE_JSON = json.dumps({
+    "id": 1,
+    "name": "Test User",
+    "email": "test@example.com",
+    "preferences": {"theme": "dark", "notifications": True}
+})
+DASHBOARD_RESPONSE_JSON = json.dumps({
+    "stats": {"orders": 5, "revenue": 1250.50, "customers": 23},
+    "recent_activity": [
+        {"type": "order", "description": "New order #1001", "time": "2 minutes ago"},
+        {"type": "customer", "description": "New customer registered", "time": "5 minutes ago"}
+    ]
+})
+
+# method, mocked URL pattern, request URL, request body, mocked response, status,
+# JS expression rendering the response as `data`, expected #result text
+CRUD_CASES = [
+    pytest.param(
+        "GET", "**/api/users", "http://localhost/api/users", None,
+        get_mock_template("users"), 200,
+        "data.users.map(user => `${user.name} (${user.email})`).join(' | ')",
+        "John Doe (john@example.com) | Jane Smith (jane@example.com) | Bob Johnson (bob@example.com)",
+        id="get_users_list",
+    ),
+    pytest.param(
+        "POST", "**/api/users", "http://localhost/api/users",
+        {"name": "Alice Cooper", "email": "alice@example.com"},
+        NEW_USER_RESPONSE_JSON, 201,
+        "`User created: ${data.name} (ID: ${data.id})`",
+        "User created: Alice Cooper (ID: 4)",
+        id="create_user_post",
+    ),
+    pytest.param(
+        "PUT", "**/api/users/1", "http://localhost/api/users/1",
+        {"name": "John Doe Updated", "email": "john.updated@example.com"},
+        UPDATED_USER_JSON, 200,
+        "`Updated: ${data.name}`",
+        "Updated: John Doe Updated",
+        id="update_user_put",
+    ),
+    pytest.param(
+        "DELETE", "**/api/users/1", "http://localhost/api/users/1", None,
+        DELETE_MESSAGE_JSON, 204,
+        "data.message",
+        "User deleted successfully",
+        id="delete_user",
+    ),
+]
+
+
+# Static pages for the pagination and workflow tests, built once at import. Their
+# behaviour lives in PAGINATION_JS / DASHBOARD_JS, which only those two tests
+# install as init scripts on their own tab, so the pages themselves are markup only.
+PAGINATION_HTML = """
+<!DOCTYPE html>
+<html>
+<body>
+    <div id="users-list"></div>
+    <button id="load-page1" onclick="loadPage(1)">Load Page 1</button>
+    <button id="load-page2" onclick="loadPage(2)">Load Page 2</button>
+    <div id="pagination-info"></div>
+</body>
+</html>
+"""
+
+PAGINATION_JS = """
+window.loadPage = async (pageNum) => {
+    const response = await fetch(`http://localhost/api/users?page=${pageNum}`);
+    const data = await response.json();
+
+    document.getElementById('users-list').innerHTML = 
+        data.users.map(user => `<div class="user">${user.name}</div>`).join('');
+
+    document.getElementById('pagination-info').innerHTML = 
+        `<div class="page-info">Page ${data.page} of ${data.total_pages} (${data.total} total users)</div>`;
+};
+"""
+
+DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html>
+<body>
+    <div id="app">
+        <div id="login-form">
+            <input type="text" id="username" value="testuser" />
+            <input type="password" id="password" value="password" />
+            <button id="login-btn" onclick="dashboardLogin()">Login</button>
+        </div>
+        <div id="dashboard" style="display:none;">
+            <div id="user-info"></div>
+            <div id="stats"></div>
+            <div id="activity"></div>
+            <button id="logout-btn" onclick="dashboardLogout()">Logout</button>
+        </div>
+        <div id="status"></div>
+    </div>
+</body>
+</html>
+"""
+
+DASHBOARD_JS = """
+window.authToken = null;
+
+window.dashboardLogin = async () => {
+    const username = document.getElementById('username').value;
+    const password = document.getElementById('password').value;
+
+    try {
+        // Step 1: Login
+        const loginResponse = await fetch('http://localhost/api/auth/login', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({username, password})
+        });
+        const loginData = await loginResponse.json();
+        window.authToken = loginData.token;
+
+        // Step 2: Load profile
+        const profileResponse = await fetch('http://localhost/api/profile', {
+            headers: {'Authorization': `Bearer ${window.authToken}`}
+        });
+        const profileData = await profileResponse.json();
+
+        // Step 3: Load dashboard
+        const dashboardResponse = await fetch('http://localhost/api/dashboard', {
+            headers: {'Authorization': `Bearer ${window.authToken}`}
+        });
+        const dashboardData = await dashboardResponse.json();
+
+        // Update UI
+        document.getElementById('login-form').style.display = 'none';
+        document.getElementById('dashboard').style.display = 'block';
+
+        document.getElementById('user-info').innerHTML = 
+            `<h2>Welcome, ${profileData.name}!</h2>`;
+
+        document.getElementById('stats').innerHTML = 
+            `<div class="stats">
+                <div>Orders: ${dashboardData.stats.orders}</div>
+                <div>Revenue: $${dashboardData.stats.revenue}</div>
+                <div>Customers: ${dashboardData.stats.customers}</div>
+            </div>`;
+
+        document.getElementById('activity').innerHTML = 
+            '<h3>Recent Activity:</h3>' +
+            dashboardData.recent_activity.map(item => 
+                `<div class="activity-item">${item.description} (${item.time})</div>`
+            ).join('');
+
+        document.getElementById('status').innerHTML = 
+            '<div class="success">Login successful!</div>';
+
+    } catch (error) {
+        document.getElementById('status').innerHTML = 
+            '<div class="error">Login failed!</div>';
+    }
+};
+
+window.dashboardLogout = () => {
+    window.authToken = null;
+    document.getElementById('login-form').style.display = 'block';
+    document.getElementById('dashboard').style.display = 'none';
+    document.getElementById('status').innerHTML = 
+        '<div class="info">Logged out</div>';
+};
+"""
+
+
+@pytest_asyncio.fixture(scope="class")
+async def _fetch_helper(shared_context):
+    """
+    Install the doFetch() helper used by the HTML templates once per shared
+    context, as an init script on every tab opened in it.
+    """
+    await shared_context.add_init_script(DO_FETCH_JS)
+
+
+@pytest.fixture
+def page(shared_page, _fetch_helper):
+    """
+    Override of the root page fixture: each test gets its own tab in the class's
+    shared browser context, with the doFetch() helper installed. Mocked routes
+    are registered on the page, so closing the tab is enough to isolate tests
+    from each other.
+
+    Returns:
+        Page: A new page in the class-scoped shared context.
+    """
+    return shared_page
 
 
 class TestBasicAPIMocking:
     """Test basic CRUD operations with API mocking."""
-    
-    @pytest.mark.asyncio
-    async def test_get_users_list(self, page, api_mocker):
-        """Test fetching a list of users from API."""
-        # Mock the users API endpoint with wildcard pattern to catch any base URL
-        users_data = get_mock_template("users")
-        await api_mocker.mock_get("**/api/users", users_data)
-        
-        # Create a simple HTML page that fetches users
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head><title>Users</title></head>
-        <body>
-            <div id="users-container">Loading...</div>
-            <script>
-                fetch('http://localhost/api/users')
-                    .then(response => response.json())
-                    .then(data => {
-                        const container = document.getElementById('users-container');
-                        container.innerHTML = data.users.map(user => 
-                            `<div class="user" data-id="${user.id}">${user.name} (${user.email})</div>`
-                        ).join('');
-                    })
-                    .catch(error => {
-                        document.getElementById('users-container').innerHTML = 'Error loading users';
-                    });
-            </script>
-        </body>
-        </html>
-        """
-        
-        await page.set_content(html_content)
-        
-        # Wait for the API call to complete and verify results
-        await page.wait_for_selector('.user')
-        users = await page.locator('.user').all()
-        
-        assert len(users) == 3
-        assert await users[0].text_content() == "John Doe (john@example.com)"
-        assert await users[1].text_content() == "Jane Smith (jane@example.com)"
-        
-        # Verify the request was logged
-        requests = api_mocker.get_request_log()
-        assert len(requests) == 1
-        assert requests[0]['method'] == 'GET'
-        assert '/api/users' in requests[0]['url']
-    
-    @pytest.mark.asyncio
-    async def test_create_user_post(self, page, api_mocker):
-        """Test creating a new user via POST request."""
-        # Mock successful user creation
-        new_user_response = {
-            "id": 4,
-            "name": "Alice Cooper",
-            "email": "alice@example.com",
-            "active": True,
-            "created_at": "2024-01-15T10:30:00Z"
-        }
-        await api_mocker.mock_post("**/api/users", new_user_response, status=201)
-        
-        # Create form to submit new user
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <form id="user-form">
-                <input type="text" id="name" value="Alice Cooper" />
-                <input type="email" id="email" value="alice@example.com" />
-                <button type="submit">Create User</button>
-            </form>
-            <div id="result"></div>
-            <script>
-                document.getElementById('user-form').addEventListener('submit', async (e) => {
-                    e.preventDefault();
-                    const formData = {
-                        name: document.getElementById('name').value,
-                        email: document.getElementById('email').value
-                    };
-                    
-                    try {
-                        const response = await fetch('http://localhost/api/users', {
-                            method: 'POST',
-                            headers: {'Content-Type': 'application/json'},
-                            body: JSON.stringify(formData)
-                        });
-                        const result = await response.json();
-                        document.getElementById('result').innerHTML = 
-                            `User created: ${result.name} (ID: ${result.id})`;
-                    } catch (error) {
-                        document.getElementById('result').innerHTML = 'Error creating user';
-                    }
-                });
-            </script>
-        </body>
-        </html>
+
+    @pytest_asyncio.fixture(scope="class")
+    async def crud_routes(self, shared_context):
         """
-        
-        await page.set_content(html_content)
-        await page.click('button[type="submit"]')
-        
-        # Verify the user was "created"
-        await page.wait_for_selector('#result')
-        result_text = await page.locator('#result').text_content()
-        assert "User created: Alice Cooper (ID: 4)" in result_text
-        
-        # Verify POST request was made
-        requests = api_mocker.get_request_log()
-        assert len(requests) == 1
-        assert requests[0]['method'] == 'POST'
-        
-        # Verify request payload
-        post_data = json.loads(requests[0]['post_data'])
-        assert post_data['name'] == 'Alice Cooper'
-        assert post_data['email'] == 'alice@example.com'
-    
-    @pytest.mark.asyncio
-    async def test_update_user_put(self, page, api_mocker):
-        """Test updating a user via PUT request."""
-        updated_user = {
-            "id": 1,
-            "name": "John Doe Updated",
-            "email": "john.updated@example.com",
-            "active": True,
-            "updated_at": "2024-01-15T11:00:00Z"
-        }
-        await api_mocker.mock_put("**/api/users/1", updated_user)
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <button id="update-btn">Update User 1</button>
-            <div id="status"></div>
-            <script>
-                document.getElementById('update-btn').addEventListener('click', async () => {
-                    const updateData = {
-                        name: "John Doe Updated",
-                        email: "john.updated@example.com"
-                    };
-                    
-                    const response = await fetch('http://localhost/api/users/1', {
-                        method: 'PUT',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify(updateData)
-                    });
-                    const result = await response.json();
-                    document.getElementById('status').innerHTML = `Updated: ${result.name}`;
-                });
-            </script>
-        </body>
-        </html>
+        Register every CRUD mock once for the class, on the shared context, so
+        each test's tab is served without setting up its own routes.
+
+        Yields:
+            NetworkMocker: Mocker holding the class's CRUD routes.
         """
-        
-        await page.set_content(html_content)
-        await page.click('#update-btn')
-        
-        await page.wait_for_selector('#status')
-        status = await page.locator('#status').text_content()
-        assert "Updated: John Doe Updated" in status
-    
+        mocker = NetworkMocker(shared_context)
+        for case in CRUD_CASES:
+            method, pattern, _url, _body, response, status = case.values[:6]
+            mock = getattr(mocker, f"mock_{method.lower()}")
+            await mock(pattern, response, status=status)
+        yield mocker
+        mocker.reset()
+
+    @pytest.fixture(autouse=True)
+    def _clear_crud_log(self, crud_routes):
+        """Start each test with an empty request log on the shared routes."""
+        crud_routes.clear_logs()
+
     @pytest.mark.asyncio
-    async def test_delete_user(self, page, api_mocker):
-        """Test deleting a user via DELETE request."""
-        await api_mocker.mock_delete("**/api/users/1", {"message": "User deleted successfully"})
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <button id="delete-btn">Delete User 1</button>
-            <div id="message"></div>
-            <script>
-                document.getElementById('delete-btn').addEventListener('click', async () => {
-                    const response = await fetch('http://localhost/api/users/1', {method: 'DELETE'});
-                    const result = await response.json();
-                    document.getElementById('message').innerHTML = result.message;
-                });
-            </script>
-        </body>
-        </html>
-        """
-        
-        await page.set_content(html_content)
-        await page.click('#delete-btn')
-        
-        await page.wait_for_selector('#message')
-        message = await page.locator('#message').text_content()
-        assert "User deleted successfully" in message
+    @pytest.mark.parametrize(
+        "method, pattern, url, body, response, status, render, expected", CRUD_CASES
+    )
+    async def test_crud(self, page, crud_routes, method, pattern, url, body,
+                        response, status, render, expected):
+        """Test each CRUD method against its mocked users endpoint."""
+        await load_html(page, FETCH_TEMPLATE.substitute(
+            METHOD=method, URL=url, BODY=json.dumps(body), RENDER=render
+        ))
+
+        # Wait for the API call to complete and verify the rendered reply
+        await expect(page.locator('#result')).to_have_text(expected)
+
+        # Verify exactly one request reached this method's mock, with the expected payload
+        requests = crud_routes.get_requests(method, pattern)
+        assert len(requests) == 1
+        assert url.replace('http://localhost', '') in requests[0]['url']
+        if body is not None:
+            assert json.loads(requests[0]['post_data']) == body
 
 
 class TestFileBasedMocking:
     """Test file-based mock data loading."""
     
-    @pytest.fixture(autouse=True)
-    def setup_mock_files(self):
-        """Create mock data files for testing."""
-        # Create test data directory
-        Path("test_data").mkdir(exist_ok=True)
+    @pytest.fixture(scope="session")
+    def mock_data_dir(self, tmp_path_factory):
+        """
+        Create mock data files once for the whole session in a pytest temp
+        directory (per xdist worker, cleaned up by pytest).
+        """
+        data_dir = tmp_path_factory.mktemp("test_data")
         
         # Create products mock file
         products_data = {
@@ -256,7 +356,7 @@ class TestFileBasedMocking:
             "page": 1,
             "per_page": 10
         }
-        create_mock_data_file("test_data/products.json", products_data)
+        create_mock_data_file(data_dir / "products.json", products_data)
         
         # Create orders mock file
         orders_data = {
@@ -265,19 +365,14 @@ class TestFileBasedMocking:
                 {"id": 1002, "user_id": 2, "total": 89.99, "status": "pending", "items": 1}
             ]
         }
-        create_mock_data_file("test_data/orders.json", orders_data)
-        
-        yield
+        create_mock_data_file(data_dir / "orders.json", orders_data)
         
-        # Cleanup (optional)
-        import shutil
-        if Path("test_data").exists():
-            shutil.rmtree("test_data")
+        return data_dir
     
     @pytest.mark.asyncio
-    async def test_load_products_from_file(self, page, api_mocker):
+    async def test_load_products_from_file(self, page, api_mocker, mock_data_dir):
         """Test loading product data from JSON file."""
-        await api_mocker.mock_from_file("**/api/products", "test_data/products.json")
+        await api_mocker.mock_from_file("**/api/products", str(mock_data_dir / "products.json"))
         
         html_content = """
         <!DOCTYPE html>
@@ -302,17 +397,36 @@ class TestFileBasedMocking:
         </html>
         """
         
-        await page.set_content(html_content)
-        await page.wait_for_selector('.product')
+        await load_html(page, html_content)
         
-        products = await page.locator('.product').all()
-        assert len(products) == 3
+        # List assertions poll the whole set in the browser, so no separate wait
+        # or per-card reads are needed
+        await expect(page.locator('.product h3')).to_have_text(
+            ["Gaming Laptop", "Wireless Mouse", "Coffee Maker"]
+        )
+        await expect(page.locator('.product .category')).to_have_text(
+            ["Electronics", "Electronics", "Kitchen"]
+        )
         
         # Verify specific product details
         laptop = page.locator('.product[data-id="1"]')
-        assert await laptop.locator('h3').text_content() == "Gaming Laptop"
-        assert "$1299.99" in await laptop.locator('p').text_content()
-        assert await laptop.locator('.category').text_content() == "Electronics"
+        await expect(laptop.locator('p')).to_contain_text("$1299.99")
+
+
+# Fixed server clock for the timestamp mock, so its body does not depend on when
+# the test runs
+SERVER_CLOCK = MappingProxyType({
+    "timestamp": 1705314600,
+    "server_time": "2024-01-15 10:30:00",
+})
+
+# Search responses by query-string fragment, for api_mocker.mock_table (serialized
+# once when the mock is registered)
+SEARCH_TABLE = MappingProxyType({
+    "q=laptop": {"results": [{"id": 1, "name": "Gaming Laptop", "price": 1299.99}], "count": 1},
+    "q=mouse": {"results": [{"id": 2, "name": "Wireless Mouse", "price": 29.99}], "count": 1},
+})
+SEARCH_EMPTY = {"results": [], "count": 0}
 
 
 class TestDynamicResponses:
@@ -323,8 +437,7 @@ class TestDynamicResponses:
         """Test dynamic response with current timestamp."""
         def timestamp_response(request):
             return {
-                "timestamp": int(time.time()),
-                "server_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                **SERVER_CLOCK,
                 "request_url": request.url,
                 "user_agent": request.headers.get("user-agent", "unknown")
             }
@@ -350,32 +463,22 @@ class TestDynamicResponses:
         </html>
         """
         
-        await page.set_content(html_content)
+        await load_html(page, html_content)
         await page.click('#get-info')
         
-        await page.wait_for_selector('#server-info div')
-        info_divs = await page.locator('#server-info div').all()
+        await page.locator('#server-info div').first.wait_for(state="attached")
+        info_texts = await page.locator('#server-info div').all_text_contents()
         
-        assert len(info_divs) == 2
-        time_text = await info_divs[0].text_content()
-        timestamp_text = await info_divs[1].text_content()
+        assert len(info_texts) == 2
+        time_text, timestamp_text = info_texts
         
-        assert "Time:" in time_text
-        assert "Timestamp:" in timestamp_text
+        assert time_text == "Time: 2024-01-15 10:30:00"
+        assert timestamp_text == "Timestamp: 1705314600"
     
     @pytest.mark.asyncio
     async def test_search_with_query_params(self, page, api_mocker):
         """Test dynamic response based on query parameters."""
-        def search_response(request):
-            url = request.url
-            if "q=laptop" in url:
-                return {"results": [{"id": 1, "name": "Gaming Laptop", "price": 1299.99}], "count": 1}
-            elif "q=mouse" in url:
-                return {"results": [{"id": 2, "name": "Wireless Mouse", "price": 29.99}], "count": 1}
-            else:
-                return {"results": [], "count": 0}
-        
-        await api_mocker.mock_with_function("**/api/search*", search_response)
+        await api_mocker.mock_table("**/api/search*", SEARCH_TABLE, default=SEARCH_EMPTY)
         
         html_content = """
         <!DOCTYPE html>
@@ -404,12 +507,12 @@ class TestDynamicResponses:
         </html>
         """
         
-        await page.set_content(html_content)
+        await load_html(page, html_content)
         
         # Test laptop search
         await page.fill('#search-input', 'laptop')
         await page.click('#search-btn')
-        await page.wait_for_selector('.result')
+        await page.locator('.result').first.wait_for(state="attached")
         
         result = await page.locator('.result').text_content()
         assert "Gaming Laptop - $1299.99" in result
@@ -417,7 +520,7 @@ class TestDynamicResponses:
         # Test no results
         await page.fill('#search-input', 'nonexistent')
         await page.click('#search-btn')
-        await page.wait_for_selector('.no-results')
+        await page.locator('.no-results').first.wait_for(state="attached")
         
         no_results = await page.locator('.no-results').text_content()
         assert "No results found" in no_results
@@ -427,81 +530,21 @@ class TestErrorHandling:
     """Test error scenarios and edge cases."""
     
     @pytest.mark.asyncio
-    async def test_api_server_error(self, page, api_mocker):
-        """Test handling of 500 server errors."""
-        error_response = {"error": "Internal server error", "code": "SERVER_ERROR"}
-        await api_mocker.mock_get("**/api/users", error_response, status=500)
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <div id="content">Loading...</div>
-            <script>
-                fetch('http://localhost/api/users')
-                    .then(response => {
-                        if (!response.ok) {
-                            throw new Error(`HTTP ${response.status}`);
-                        }
-                        return response.json();
-                    })
-                    .then(data => {
-                        document.getElementById('content').innerHTML = 'Success!';
-                    })
-                    .catch(error => {
-                        document.getElementById('content').innerHTML = 
-                            `<div class="error">Error: ${error.message}</div>`;
-                    });
-            </script>
-        </body>
-        </html>
-        """
-        
-        await page.set_content(html_content)
-        await page.wait_for_selector('.error')
-        
-        error_text = await page.locator('.error').text_content()
-        assert "Error: HTTP 500" in error_text
-    
-    @pytest.mark.asyncio
-    async def test_api_not_found(self, page, api_mocker):
-        """Test handling of 404 not found errors."""
-        await api_mocker.mock_get("**/api/users/999", {"error": "User not found"}, status=404)
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <button id="load-user">Load User 999</button>
-            <div id="user-info"></div>
-            <script>
-                document.getElementById('load-user').addEventListener('click', async () => {
-                    try {
-                        const response = await fetch('http://localhost/api/users/999');
-                        if (response.status === 404) {
-                            document.getElementById('user-info').innerHTML = 
-                                '<div class="not-found">User not found</div>';
-                        } else {
-                            const data = await response.json();
-                            document.getElementById('user-info').innerHTML = 
-                                `<div>User: ${data.name}</div>`;
-                        }
-                    } catch (error) {
-                        document.getElementById('user-info').innerHTML = 
-                            '<div class="error">Network error</div>';
-                    }
-                });
-            </script>
-        </body>
-        </html>
-        """
-        
-        await page.set_content(html_content)
-        await page.click('#load-user')
-        await page.wait_for_selector('.not-found')
-        
-        not_found = await page.locator('.not-found').text_content()
-        assert "User not found" in not_found
+    @pytest.mark.parametrize("pattern, url, status, body, expected", [
+        ("**/api/users", "http://localhost/api/users", 500,
+         {"error": "Internal server error", "code": "SERVER_ERROR"}, "Error: HTTP 500"),
+        ("**/api/users/999", "http://localhost/api/users/999", 404,
+         {"error": "User not found"}, "User not found"),
+    ], ids=["500", "404"])
+    async def test_api_error_status(self, page, api_mocker, pattern, url, status, body, expected):
+        """Test handling of 500 server errors and 404 not found errors."""
+        await api_mocker.mock_get(pattern, body, status=status)
+        
+        await load_html(page, ERROR_TEMPLATE.substitute(URL=url))
+        await page.locator('#result:not(:empty)').first.wait_for(state="attached")
+        
+        error_text = await page.locator('#result').text_content()
+        assert expected in error_text
 
 
 class TestNetworkConditions:
@@ -511,7 +554,9 @@ class TestNetworkConditions:
     async def test_slow_network_simulation(self, page, api_mocker):
         """Test behavior under slow network conditions."""
         users_data = get_mock_template("users")
-        await api_mocker.mock_get("**/api/users", users_data, delay=2000)  # 2 second delay
+        # A short delay is enough to observe the loading state; the mocker
+        # records the delay it applied, so no wall-clock wait is needed
+        await api_mocker.mock_get("**/api/users", users_data, delay=50)
         
         html_content = """
         <!DOCTYPE html>
@@ -549,7 +594,7 @@ class TestNetworkConditions:
         </html>
         """
         
-        await page.set_content(html_content)
+        await load_html(page, html_content)
         await page.click('#load-users')
         
         # Verify loading indicator appears
@@ -557,14 +602,16 @@ class TestNetworkConditions:
         await loading.wait_for(state='visible')
         
         # Wait for completion
-        await page.wait_for_selector('.load-time', timeout=5000)
+        await page.locator('.load-time').first.wait_for(state="attached", timeout=5000)
         
         load_time_text = await page.locator('.load-time').text_content()
         user_count_text = await page.locator('.user-count').text_content()
         
-        # Should take at least 2 seconds due to delay
         assert "ms" in load_time_text
         assert "3 users loaded" in user_count_text
+        
+        # The response was held back by the configured delay
+        assert api_mocker.get_response_log()[-1]['delay'] == 50
     
     @pytest.mark.asyncio
     async def test_network_failure_simulation(self, page, api_mocker):
@@ -592,9 +639,9 @@ class TestNetworkConditions:
         </html>
         """
         
-        await page.set_content(html_content)
+        await load_html(page, html_content)
         await page.click('#load-data')
-        await page.wait_for_selector('.network-error')
+        await page.locator('.network-error').first.wait_for(state="attached")
         
         error_text = await page.locator('.network-error').text_content()
         assert "Network request failed" in error_text
@@ -631,9 +678,9 @@ class TestNetworkConditions:
         </html>
         """
         
-        await page.set_content(html_content)
+        await load_html(page, html_content)
         await page.click('#test-connection')
-        await page.wait_for_selector('.offline')
+        await page.locator('.offline').first.wait_for(state="attached")
         
         offline_text = await page.locator('.offline').text_content()
         assert "Offline mode detected" in offline_text
@@ -643,171 +690,36 @@ class TestAdvancedScenarios:
     """Test advanced API scenarios like authentication, pagination, etc."""
     
     @pytest.mark.asyncio
-    async def test_authentication_headers(self, page, api_mocker):
-        """Test API calls with authentication headers."""
-        # Test valid authentication first
-        await api_mocker.mock_get("**/api/me", {"user": {"id": 1, "name": "Authenticated User", "role": "admin"}})
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <button id="test-auth">Test Auth</button>
-            <div id="user-info"></div>
-            <script>
-                document.getElementById('test-auth').addEventListener('click', async () => {
-                    try {
-                        const response = await fetch('http://localhost/api/me', {
-                            headers: {
-                                'Authorization': 'Bearer valid-token'
-                            }
-                        });
-                        
-                        if (response.ok) {
-                            const data = await response.json();
-                            document.getElementById('user-info').innerHTML = 
-                                `<div class="success">Welcome, ${data.user.name}!</div>`;
-                        } else {
-                            document.getElementById('user-info').innerHTML = 
-                                '<div class="auth-error">Authentication failed</div>';
-                        }
-                    } catch (error) {
-                        document.getElementById('user-info').innerHTML = 
-                            '<div class="error">Request failed</div>';
-                    }
-                });
-            </script>
-        </body>
-        </html>
-        """
-        
-        await page.set_content(html_content)
-        
-        # Test valid authentication
-        await page.click('#test-auth')
-        await page.wait_for_selector('.success')
-        success_text = await page.locator('.success').text_content()
-        assert "Welcome, Authenticated User!" in success_text
-        
-        print("✅ Authentication test passed!")
-    
-    @pytest.mark.asyncio
-    async def test_authentication_error_handling(self, page, api_mocker):
-        """Test authentication error handling."""
-        # Mock with error response and 401 status
-        await api_mocker.mock_get("**/api/me", {"error": "Unauthorized"}, status=401)
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <button id="test-auth">Test Auth</button>
-            <div id="user-info"></div>
-            <script>
-                document.getElementById('test-auth').addEventListener('click', async () => {
-                    try {
-                        const response = await fetch('http://localhost/api/me', {
-                            headers: {
-                                'Authorization': 'Bearer invalid-token'
-                            }
-                        });
-                        
-                        if (response.ok) {
-                            const data = await response.json();
-                            document.getElementById('user-info').innerHTML = 
-                                `<div class="success">Welcome, ${data.user.name}!</div>`;
-                        } else {
-                            document.getElementById('user-info').innerHTML = 
-                                '<div class="auth-error">Authentication failed</div>';
-                        }
-                    } catch (error) {
-                        document.getElementById('user-info').innerHTML = 
-                            '<div class="error">Request failed</div>';
-                    }
-                });
-            </script>
-        </body>
-        </html>
-        """
+    @pytest.mark.parametrize("token, status, body, selector, text", [
+        ("valid-token", 200, AUTH_USER_RESPONSE_JSON, ".success", "Welcome, Authenticated User!"),
+        ("invalid-token", 401, UNAUTH_RESPONSE_JSON, ".auth-error", "Authentication failed"),
+    ], ids=["authorized", "unauthorized"])
+    async def test_authentication(self, page, api_mocker, token, status, body, selector, text):
+        """Test API calls with valid and invalid authentication headers."""
+        await api_mocker.mock_get("**/api/me", body, status=status)
         
-        await page.set_content(html_content)
+        await load_html(page, AUTH_TEMPLATE.substitute(TOKEN=token))
         
-        # Test invalid authentication
         await page.click('#test-auth')
-        await page.wait_for_selector('.auth-error')
-        error_text = await page.locator('.auth-error').text_content()
-        assert "Authentication failed" in error_text
-        
-        print("✅ Authentication error test passed!")
+        await page.locator(selector).first.wait_for(state="attached")
+        result_text = await page.locator(selector).text_content()
+        assert text in result_text
     
     @pytest.mark.asyncio
     async def test_pagination_scenario(self, page, api_mocker):
         """Test paginated API responses."""
-        # Mock page 1
-        page1_data = {
-            "users": [
-                {"id": 1, "name": "User 1"},
-                {"id": 2, "name": "User 2"},
-                {"id": 3, "name": "User 3"}
-            ],
-            "page": 1,
-            "per_page": 3,
-            "total": 7,
-            "total_pages": 3,
-            "has_next": True
-        }
-        await api_mocker.mock_get("**/api/users?page=1", page1_data)
-        
-        # Mock page 2
-        page2_data = {
-            "users": [
-                {"id": 4, "name": "User 4"},
-                {"id": 5, "name": "User 5"},
-                {"id": 6, "name": "User 6"}
-            ],
-            "page": 2,
-            "per_page": 3,
-            "total": 7,
-            "total_pages": 3,
-            "has_next": True
-        }
-        await api_mocker.mock_get("**/api/users?page=2", page2_data)
-        
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <body>
-            <div id="users-list"></div>
-            <button id="load-page1">Load Page 1</button>
-            <button id="load-page2">Load Page 2</button>
-            <div id="pagination-info"></div>
-            <script>
-                async function loadPage(pageNum) {
-                    const response = await fetch(`http://localhost/api/users?page=${pageNum}`);
-                    const data = await response.json();
-                    
-                    document.getElementById('users-list').innerHTML = 
-                        data.users.map(user => `<div class="user">${user.name}</div>`).join('');
-                    
-                    document.getElementById('pagination-info').innerHTML = 
-                        `<div class="page-info">Page ${data.page} of ${data.total_pages} (${data.total} total users)</div>`;
-                }
-                
-                document.getElementById('load-page1').addEventListener('click', () => loadPage(1));
-                document.getElementById('load-page2').addEventListener('click', () => loadPage(2));
-            </script>
-        </body>
-        </html>
-        """
+        # The two page mocks are independent, so register them concurrently
+        await asyncio.gather(
+            api_mocker.mock_get("**/api/users?page=1", USERS_PAGE1_JSON),
+            api_mocker.mock_get("**/api/users?page=2", USERS_PAGE2_JSON),
+        )
         
-        await page.set_content(html_content)
+        await page.add_init_script(PAGINATION_JS)
+        await load_html(page, PAGINATION_HTML)
         
         # Test page 1
         await page.click('#load-page1')
-        await page.wait_for_selector('.user')
-        users_page1 = await page.locator('.user').all()
-        assert len(users_page1) == 3
-        assert await users_page1[0].text_content() == "User 1"
+        await expect(page.locator('.user')).to_have_text(["User 1", "User 2", "User 3"])
         
         page_info = await page.locator('.page-info').text_content()
         assert "Page 1 of 3" in page_info
@@ -815,10 +727,9 @@ class TestAdvancedScenarios:
         
         # Test page 2
         await page.click('#load-page2')
-        await page.wait_for_selector('.user')
-        users_page2 = await page.locator('.user').all()
-        assert len(users_page2) == 3
-        assert await users_page2[0].text_content() == "User 4"
+        # Page 1's users are still attached until page 2 renders, so wait on the
+        # new texts rather than on the elements existing
+        await expect(page.locator('.user')).to_have_text(["User 4", "User 5", "User 6"])
 
 
 @pytest.mark.asyncio
@@ -827,155 +738,53 @@ async def test_comprehensive_api_workflow(page, api_mocker):
     Test a complete API workflow combining multiple operations.
     This simulates a real application flow with multiple API calls.
     """
-    # Mock authentication
-    await api_mocker.mock_post("**/api/auth/login", {
-        "token": "abc123",
-        "user": {"id": 1, "name": "Test User", "role": "user"}
-    })
-    
-    # Mock user profile
-    await api_mocker.mock_get("**/api/profile", {
-        "id": 1,
-        "name": "Test User",
-        "email": "test@example.com",
-        "preferences": {"theme": "dark", "notifications": True}
-    })
-    
-    # Mock dashboard data
-    await api_mocker.mock_get("**/api/dashboard", {
-        "stats": {"orders": 5, "revenue": 1250.50, "customers": 23},
-        "recent_activity": [
-            {"type": "order", "description": "New order #1001", "time": "2 minutes ago"},
-            {"type": "customer", "description": "New customer registered", "time": "5 minutes ago"}
-        ]
-    })
-    
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <body>
-        <div id="app">
-            <div id="login-form">
-                <input type="text" id="username" value="testuser" />
-                <input type="password" id="password" value="password" />
-                <button id="login-btn">Login</button>
-            </div>
-            <div id="dashboard" style="display:none;">
-                <div id="user-info"></div>
-                <div id="stats"></div>
-                <div id="activity"></div>
-                <button id="logout-btn">Logout</button>
-            </div>
-            <div id="status"></div>
-        </div>
-        <script>
-            let authToken = null;
-            
-            document.getElementById('login-btn').addEventListener('click', async () => {
-                const username = document.getElementById('username').value;
-                const password = document.getElementById('password').value;
-                
-                try {
-                    // Step 1: Login
-                    const loginResponse = await fetch('http://localhost/api/auth/login', {
-                        method: 'POST',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify({username, password})
-                    });
-                    const loginData = await loginResponse.json();
-                    authToken = loginData.token;
-                    
-                    // Step 2: Load profile
-                    const profileResponse = await fetch('http://localhost/api/profile', {
-                        headers: {'Authorization': `Bearer ${authToken}`}
-                    });
-                    const profileData = await profileResponse.json();
-                    
-                    // Step 3: Load dashboard
-                    const dashboardResponse = await fetch('http://localhost/api/dashboard', {
-                        headers: {'Authorization': `Bearer ${authToken}`}
-                    });
-                    const dashboardData = await dashboardResponse.json();
-                    
-                    // Update UI
-                    document.getElementById('login-form').style.display = 'none';
-                    document.getElementById('dashboard').style.display = 'block';
-                    
-                    document.getElementById('user-info').innerHTML = 
-                        `<h2>Welcome, ${profileData.name}!</h2>`;
-                    
-                    document.getElementById('stats').innerHTML = 
-                        `<div class="stats">
-                            <div>Orders: ${dashboardData.stats.orders}</div>
-                            <div>Revenue: $${dashboardData.stats.revenue}</div>
-                            <div>Customers: ${dashboardData.stats.customers}</div>
-                        </div>`;
-                    
-                    document.getElementById('activity').innerHTML = 
-                        '<h3>Recent Activity:</h3>' +
-                        dashboardData.recent_activity.map(item => 
-                            `<div class="activity-item">${item.description} (${item.time})</div>`
-                        ).join('');
-                    
-                    document.getElementById('status').innerHTML = 
-                        '<div class="success">Login successful!</div>';
-                        
-                } catch (error) {
-                    document.getElementById('status').innerHTML = 
-                        '<div class="error">Login failed!</div>';
-                }
-            });
-            
-            document.getElementById('logout-btn').addEventListener('click', () => {
-                authToken = null;
-                document.getElementById('login-form').style.display = 'block';
-                document.getElementById('dashboard').style.display = 'none';
-                document.getElementById('status').innerHTML = 
-                    '<div class="info">Logged out</div>';
-            });
-        </script>
-    </body>
-    </html>
-    """
+    # Mock authentication, user profile and dashboard data concurrently
+    await asyncio.gather(
+        api_mocker.mock_post("**/api/auth/login", LOGIN_RESPONSE_JSON),
+        api_mocker.mock_get("**/api/profile", PROFILE_RESPONSE_JSON),
+        api_mocker.mock_get("**/api/dashboard", DASHBOARD_RESPONSE_JSON),
+    )
     
-    await page.set_content(html_content)
+    await page.add_init_script(DASHBOARD_JS)
+    await load_html(page, DASHBOARD_HTML)
     
     # Perform login workflow
     await page.click('#login-btn')
     
-    # Wait for dashboard to load
-    await page.wait_for_selector('#dashboard[style*="block"]')
-    await page.wait_for_selector('.success')
+    # Wait for dashboard to load; the success banner is rendered last, after
+    # every dashboard section, so one wait covers them all
+    await expect(page.locator('.success')).to_be_visible()
     
-    # Verify all components loaded
-    welcome_text = await page.locator('#user-info h2').text_content()
+    # Verify all components loaded, reading them concurrently
+    dashboard_visible, welcome_text, stats_texts, activity_texts, success_msg = await asyncio.gather(
+        page.locator('#dashboard').is_visible(),
+        page.locator('#user-info h2').text_content(),
+        page.locator('.stats div').all_text_contents(),
+        page.locator('.activity-item').all_text_contents(),
+        page.locator('.success').text_content(),
+    )
+    assert dashboard_visible
     assert "Welcome, Test User!" in welcome_text
     
-    stats_divs = await page.locator('.stats div').all()
-    assert len(stats_divs) == 3
-    assert "Orders: 5" in await stats_divs[0].text_content()
-    assert "Revenue: $1250.5" in await stats_divs[1].text_content()
-    
-    activity_items = await page.locator('.activity-item').all()
-    assert len(activity_items) == 2
-    assert "New order #1001" in await activity_items[0].text_content()
+    assert stats_texts == ["Orders: 5", "Revenue: $1250.5", "Customers: 23"]
+    assert activity_texts == [
+        "New order #1001 (2 minutes ago)",
+        "New customer registered (5 minutes ago)",
+    ]
     
-    success_msg = await page.locator('.success').text_content()
     assert "Login successful!" in success_msg
     
     # Verify all API calls were made
-    requests = api_mocker.get_request_log()
-    assert len(requests) == 3
-    assert requests[0]['method'] == 'POST'  # Login
-    assert requests[1]['method'] == 'GET'   # Profile
-    assert requests[2]['method'] == 'GET'   # Dashboard
+    assert api_mocker.request_count == 3
+    assert api_mocker.get_request(0)['method'] == 'POST'  # Login
+    assert api_mocker.get_request(1)['method'] == 'GET'   # Profile
+    assert api_mocker.get_request(2)['method'] == 'GET'   # Dashboard
     
     # Test logout
     await page.click('#logout-btn')
-    await page.wait_for_selector('#login-form[style*="block"]')
-    
-    logout_msg = await page.locator('.info').text_content()
-    assert "Logged out" in logout_msg
+    await expect(page.locator('#login-form')).to_be_visible()
+    await expect(page.locator('.info')).to_contain_text("Logged out")
     
-    # Print network activity summary
-    api_mocker.print_network_activity()
\ No newline at end of file
+    # Print network activity summary when debug output is on
+    if settings.DEBUG_MSG:
+        api_mocker.print_network_activity()
\ No newline at end of file
@@ -36,6 +36,22 @@ from utils.decorators.screenshot_decorator import screenshot_on_failure
 from utils.debug import debug_print
 
 
+# ------------------------------------------------------------------------------
+# Fixture: page (module override)
+# ------------------------------------------------------------------------------
+
+@pytest.fixture
+def page(module_page):
+    """
+    Override of the root page fixture: every test in this module opens a new tab
+    in one shared browser context instead of creating its own context. Cookies
+    are cleared after each test, so every test starts logged out.
+
+    Returns:
+        Page: A new page in the module's shared context.
+    """
+    return module_page
+
 # ------------------------------------------------------------------------------
 # Test: Loads page and fails to generate screenshot
 # ------------------------------------------------------------------------------
@@ -106,6 +122,33 @@ async def test_login_direct_valid_credentials(page):
     debug_print("Valid login test completed successfully")
 
 
+# ------------------------------------------------------------------------------
+# Test: Fast Login (single round-trip submit)
+# ------------------------------------------------------------------------------
+
+@screenshot_on_failure
+@pytest.mark.login
+@pytest.mark.asyncio
+async def test_login_fast_login_valid_credentials(page):
+    """
+    Test login with fast_login=True, which sets both fields and submits the form
+    in one page.evaluate call. Verifies it lands on the secure area like the
+    regular fill/click flow.
+    """
+    debug_print("Starting fast login test")
+    app = App(page)
+
+    await app.login_page.navigate()
+    await app.login_page.login("tomsmith", "SuperSecretPassword!", fast_login=True)
+
+    # Verify successful login by checking secure page
+    assert await app.secure_page.is_on_secure_page()
+
+    flash_text = await app.secure_page.get_flash_message_text()
+    assert "You logged into a secure area!" in flash_text
+    debug_print("Fast login test completed successfully")
+
+
 # ------------------------------------------------------------------------------
 # Test: Invalid Username Scenario
 # ------------------------------------------------------------------------------
@@ -202,24 +245,24 @@ async def test_login_empty_credentials(page):
 @pytest.mark.login
 @pytest.mark.smoke
 @pytest.mark.asyncio
-async def test_logout_functionality(page):
+async def test_logout_functionality(authenticated_page):
     """
-    Test logout functionality after successful login.
-    Verifies complete login-logout workflow.
+    Test logout functionality from an already authenticated session.
+    Starts in the secure area using the session's stored login state (the
+    login form itself is covered by the valid credentials tests).
     """
     debug_print("Starting logout functionality test")
-    app = App(page)
+    app = App(authenticated_page)
     
-    # First login successfully
-    await app.login_page.navigate()
-    await app.login_page.login_with_demo_user()
-    assert await app.secure_page.is_on_secure_page()
+    # Start in the secure area, already logged in
+    await app.secure_page.navigate()
+    assert await app.secure_page.is_authenticated()
     
     # Then logout
     await app.secure_page.logout()
     
-    # Should be back on login page
-    assert await app.login_page.is_on_login_page()
+    # Should be back on login page (retried until the redirect lands)
+    await app.login_page.expect_url_contains("/login")
     
     # Verify logout message
     flash_text = await app.login_page.get_flash_message()
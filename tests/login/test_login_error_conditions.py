@@ -227,17 +227,15 @@ async def test_form_field_clearing_and_retry(app):
     await app.login_page.enter_username("invalid_user")
     await app.login_page.enter_password("invalid_pass")
     
-    # Verify data was entered
-    username_value = await app.login_page.get_username_value()
-    assert username_value == "invalid_user"
+    # Verify data was entered (both fields read in one round-trip)
+    assert await app.login_page.get_form_values() == ("invalid_user", "invalid_pass")
     
     # Clear fields
     await app.login_page.clear_username()
     await app.login_page.clear_password()
     
     # Verify fields are cleared
-    username_value = await app.login_page.get_username_value()
-    assert username_value == ""
+    assert await app.login_page.get_form_values() == ("", "")
     
     # Now try with valid credentials
     await app.login_page.login_with_demo_user()
@@ -0,0 +1,137 @@
+"""
+===============================================================================
+Test Data Unit Tests
+===============================================================================
+
+This module contains browser-free unit tests for data.test_data: the shape of
+the shared credential records and the payload scanning helpers.
+
+Features:
+    ✓ Credential records stay JSON-serializable
+    ✓ detect_injection reports the payload family and key
+    ✓ scan_for_attacks matches longest-first, without overlaps, in text order
+    ✓ contains_attack flags every attack string and nothing else
+
+Usage Example:
+    pytest tests/unit/test_data_helpers.py
+
+Conventions:
+    - Tests only import data.test_data; no browser or fixtures are needed
+
+Author: PMAC
+===============================================================================
+"""
+
+import json
+import pytest
+from data import test_data
+from data.test_data import (
+    INVALID_USERS, XSS_PAYLOADS, contains_attack, detect_injection, scan_for_attacks,
+)
+
+
+# ------------------------------------------------------------------------------
+# Fixture: attack_strings
+# ------------------------------------------------------------------------------
+
+@pytest.fixture
+def attack_strings(monkeypatch):
+    """
+    Swap in a custom ATTACK_STRINGS tuple for one test, rebuilding the cached
+    pattern before and after.
+
+    Yields:
+        callable: Call with the attack strings to use.
+    """
+    def use(*attacks):
+        monkeypatch.setattr(test_data, "ATTACK_STRINGS", attacks)
+        test_data._attack_re.cache_clear()
+
+    yield use
+    test_data._attack_re.cache_clear()
+
+
+# ------------------------------------------------------------------------------
+# Test: Invalid User Records
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("key", list(INVALID_USERS))
+def test_invalid_user_records_are_json_serializable(key):
+    """Each record serializes as-is, while the outer mapping stays read-only."""
+    record = INVALID_USERS[key]
+    assert json.loads(json.dumps(record)) == record
+    with pytest.raises(TypeError):
+        INVALID_USERS[key] = {}
+
+
+# ------------------------------------------------------------------------------
+# Test: detect_injection
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("text, expected", [
+    ("; ls", ("command", "basic")),
+    ("name=' OR '1'='1", ("sql", "basic_or")),
+    ("<SCRIPT>alert('xss')</SCRIPT>", ("xss", "basic_script")),
+])
+def test_detect_injection_returns_family_and_key(text, expected):
+    """Each match names its payload family, so same-named keys cannot be confused."""
+    assert detect_injection(text) == expected
+
+
+def test_detect_injection_prefers_longest_payload():
+    """A payload containing another (iframe wrapping javascript:) is reported in full."""
+    assert detect_injection(XSS_PAYLOADS["iframe"]) == ("xss", "iframe")
+
+
+def test_detect_injection_no_match():
+    """Clean text returns None."""
+    assert detect_injection("tomsmith logged in") is None
+
+
+# ------------------------------------------------------------------------------
+# Test: scan_for_attacks
+# ------------------------------------------------------------------------------
+
+def test_scan_for_attacks_reports_matches_in_text_order():
+    """Every attack found is yielded with its ATTACK_STRINGS index, in text order."""
+    text = "q=; ls -la&name=' OR '1'='1"
+    assert list(scan_for_attacks(text)) == [
+        (test_data.ATTACK_STRINGS.index("; ls -la"), "; ls -la"),
+        (test_data.ATTACK_STRINGS.index("' OR '1'='1"), "' OR '1'='1"),
+    ]
+
+
+def test_scan_for_attacks_skips_overlapping_matches():
+    """A match starting inside a previous match is not reported again."""
+    attack = "*)(uid=*"
+    # The second copy shares the first one's trailing "*"
+    assert list(scan_for_attacks(attack + ")(uid=*")) == [
+        (test_data.ATTACK_STRINGS.index(attack), attack),
+    ]
+
+
+def test_scan_for_attacks_prefers_longest_match(attack_strings):
+    """When one attack string contains another, the longer one is reported."""
+    attack_strings("drop", "drop table")
+    assert list(scan_for_attacks("x drop table y drop")) == [(1, "drop table"), (0, "drop")]
+
+
+def test_scan_for_attacks_no_match():
+    """Clean text yields nothing."""
+    assert list(scan_for_attacks("tomsmith logged in")) == []
+
+
+# ------------------------------------------------------------------------------
+# Test: contains_attack
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("attack", test_data.ATTACK_STRINGS)
+def test_contains_attack_finds_each_attack_string(attack):
+    """Every attack string is found, including when embedded in other text."""
+    assert contains_attack(f"value={attack}&next=1")
+
+
+def test_contains_attack_no_match():
+    """Clean text, and text that only resembles an attack, is not flagged."""
+    assert not contains_attack("tomsmith logged in")
+    assert not contains_attack("<script>console.log('ok')</script>")
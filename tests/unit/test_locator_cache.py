@@ -0,0 +1,133 @@
+"""
+===============================================================================
+Healed Locator Cache Unit Tests
+===============================================================================
+
+This module contains browser-free unit tests for utils.locator_cache: loading
+the healed selector files, looking selectors up per page, and saving new
+entries without losing existing ones.
+
+Features:
+    ✓ Substitution only happens when USE_HEALED_SELECTORS is enabled
+    ✓ Entries are scoped to the page path they were healed on
+    ✓ Saves merge with the file on disk; xdist workers write separate files
+
+Usage Example:
+    pytest tests/unit/test_locator_cache.py
+
+Conventions:
+    - Each test points the cache at its own tmp_path file
+    - The per-process load cache is cleared before and after every test
+
+Author: PMAC
+===============================================================================
+"""
+
+import json
+from types import SimpleNamespace
+import pytest
+from utils import locator_cache
+
+LOGIN_URL = "https://the-internet.herokuapp.com/login"
+SECURE_URL = "https://the-internet.herokuapp.com/secure"
+
+
+# ------------------------------------------------------------------------------
+# Fixture: cache_file
+# ------------------------------------------------------------------------------
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """
+    Point the healed selector cache at a temporary file with substitution on.
+
+    Returns:
+        Path: The (not yet existing) shared cache file.
+    """
+    path = tmp_path / "healed_selectors.json"
+    monkeypatch.setattr(locator_cache, "HEALED_SELECTORS_FILE", path)
+    monkeypatch.setattr(locator_cache, "ensure_directories", lambda: None)
+    monkeypatch.setattr(locator_cache, "settings", SimpleNamespace(USE_HEALED_SELECTORS=True))
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    locator_cache._load_healed_selectors.cache_clear()
+    yield path
+    locator_cache._load_healed_selectors.cache_clear()
+
+
+# ------------------------------------------------------------------------------
+# Test: Load
+# ------------------------------------------------------------------------------
+
+def test_load_merges_shared_and_worker_files(cache_file):
+    """Entries from the shared file and every worker file are all loaded."""
+    cache_file.write_text(json.dumps({"/login": {"#a": "#a1"}}))
+    cache_file.with_name("healed_selectors.gw0.json").write_text(
+        json.dumps({"/login": {"#b": "#b1"}, "/secure": {"h2": "h3"}})
+    )
+
+    assert locator_cache._load_healed_selectors() == {
+        "/login": {"#a": "#a1", "#b": "#b1"},
+        "/secure": {"h2": "h3"},
+    }
+
+
+def test_load_ignores_missing_and_corrupt_files(cache_file):
+    """A missing or unreadable cache loads as empty instead of failing."""
+    assert locator_cache._load_healed_selectors() == {}
+
+    locator_cache._load_healed_selectors.cache_clear()
+    cache_file.write_text("{not json")
+    assert locator_cache._load_healed_selectors() == {}
+
+
+# ------------------------------------------------------------------------------
+# Test: Lookup
+# ------------------------------------------------------------------------------
+
+def test_lookup_is_scoped_to_page_path(cache_file, capsys):
+    """A healed selector only applies on the page it was healed on, and is logged."""
+    cache_file.write_text(json.dumps({"/login": {"h2": "h2.title"}}))
+
+    assert locator_cache.healed_selector("h2", LOGIN_URL) == "h2.title"
+    assert "h2 -> h2.title" in capsys.readouterr().out
+    assert locator_cache.healed_selector("h2", SECURE_URL) == "h2"
+    assert locator_cache.healed_selector("#username", LOGIN_URL) == "#username"
+
+
+def test_lookup_disabled_by_default(cache_file, monkeypatch):
+    """With USE_HEALED_SELECTORS off the written selector is always used."""
+    cache_file.write_text(json.dumps({"/login": {"h2": "h2.title"}}))
+    monkeypatch.setattr(locator_cache, "settings", SimpleNamespace(USE_HEALED_SELECTORS=False))
+
+    assert locator_cache.healed_selector("h2", LOGIN_URL) == "h2"
+
+
+# ------------------------------------------------------------------------------
+# Test: Save
+# ------------------------------------------------------------------------------
+
+def test_save_merges_with_file_on_disk(cache_file):
+    """Saving re-reads the file, so entries written since the load are kept."""
+    locator_cache._load_healed_selectors()
+    cache_file.write_text(json.dumps({"/login": {"#a": "#a1"}}))
+
+    locator_cache.save_healed_selector(LOGIN_URL, "#b", "#b1")
+    locator_cache.save_healed_selector(SECURE_URL + "?x=1", "h2", "h3")
+
+    assert json.loads(cache_file.read_text()) == {
+        "/login": {"#a": "#a1", "#b": "#b1"},
+        "/secure": {"h2": "h3"},
+    }
+    assert list(cache_file.parent.glob("*.tmp")) == []
+
+
+def test_save_uses_worker_file_under_xdist(cache_file, monkeypatch):
+    """Each xdist worker writes its own file, which later loads still pick up."""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+
+    locator_cache.save_healed_selector(LOGIN_URL, "#passwordx", "#password")
+
+    assert not cache_file.exists()
+    worker_file = cache_file.with_name("healed_selectors.gw1.json")
+    assert json.loads(worker_file.read_text()) == {"/login": {"#passwordx": "#password"}}
+    assert locator_cache.healed_selector("#passwordx", LOGIN_URL) == "#password"
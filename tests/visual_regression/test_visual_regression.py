@@ -96,8 +96,7 @@ async def test_homepage_visual_baseline(page: Page, visual_regression):
     </html>
     """
     
-    await page.set_content(html_content)
-    await page.wait_for_load_state("networkidle")
+    await page.set_content(html_content, wait_until="networkidle")
     
     # Take baseline screenshot with 1% tolerance
     await visual_regression("homepage_baseline", tolerance=0.01)
@@ -160,8 +159,7 @@ async def test_homepage_visual_small_change(page: Page, visual_regression):
     </html>
     """
     
-    await page.set_content(html_content)
-    await page.wait_for_load_state("networkidle")
+    await page.set_content(html_content, wait_until="networkidle")
     
     # Should pass with higher tolerance
     await visual_regression("small_change_test", tolerance=0.02)
@@ -268,8 +266,7 @@ async def test_homepage_visual_major_change_should_fail(page: Page, visual_regre
     </html>
     """
     
-    await page.set_content(html_content)
-    await page.wait_for_load_state("networkidle")
+    await page.set_content(html_content, wait_until="networkidle")
     
     # This should DEFINITELY fail with even a very high tolerance
     # Using pytest.raises to expect the assertion error
@@ -315,8 +312,7 @@ async def test_element_specific_visual_regression(page: Page, visual_regression)
     </html>
     """
     
-    await page.set_content(html_content)
-    await page.wait_for_load_state("networkidle")
+    await page.set_content(html_content, wait_until="networkidle")
     
     # Test screenshot of specific element only
     await visual_regression("header_element", selector="#test-header", tolerance=0.01)
@@ -38,7 +38,8 @@ import subprocess
 import time
 import shutil
 import ollama
-from config.artifact_paths import AI_HEALING_REPORT_DIR
+from config.artifact_paths import AI_HEALING_REPORT_DIR, SCREENSHOT_DIR, ensure_directories
+from utils.locator_cache import save_healed_selector
 
 from utils.debug import debug_print
 import re
@@ -78,6 +79,8 @@ class OllamaAIHealingService:
         self.temperature = float(os.getenv("OLLAMA_TEMPERATURE", "0.1"))
         self.context_window = int(os.getenv("AI_HEALING_CONTEXT_WINDOW", "5000"))
         self.client = ollama.Client(host=self.ollama_host)
+        # Failure contexts awaiting AI healing, keyed by pytest node id
+        self._pending_contexts = {}
 
     async def capture_failure_context(self, page, error, test_name, test_function):
         """
@@ -97,10 +100,9 @@ class OllamaAIHealingService:
                 context["url"] = page.url  # <-- FIXED: no ()
                 context["title"] = await page.title()  # <-- Only title() is a coroutine
 
-                screenshot_dir = Path("test_artifacts/allure/screenshots")
-                screenshot_dir.mkdir(exist_ok=True)
+                ensure_directories()
                 timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                screenshot_path = screenshot_dir / f"{test_name}_{timestamp}_ai_healing.png"
+                screenshot_path = SCREENSHOT_DIR / f"{test_name}_{timestamp}_ai_healing.png"
                 await page.screenshot(path=str(screenshot_path))
                 context["screenshot_path"] = str(screenshot_path)
                 dom_content = await page.content()
@@ -167,6 +169,8 @@ class OllamaAIHealingService:
             3. **Suggested Fix**: Specific code changes or approach to fix the test
             4. **Updated Test Code**: Always provide a corrected version of the test code that fixes the failure. Return only the updated test function code in Python.
             5. **Recommendations**: Additional suggestions for test stability
+            6. **Selectors**: If the failure is a broken selector, the failing selector exactly
+               as it appears in the error message and the selector that should replace it
 
             IMPORTANT: Respond ONLY with a valid JSON object, no markdown formatting or extra text.
 
@@ -176,7 +180,9 @@ class OllamaAIHealingService:
                 "confidence": 0.85,
                 "suggested_fix": "Specific fix recommendation",
                 "updated_test_code": "Complete fixed test code (if confident)",
-                "recommendations": "Additional recommendations for improvement"
+                "recommendations": "Additional recommendations for improvement",
+                "failed_selector": "Selector that failed (empty if not a selector issue)",
+                "healed_selector": "Replacement selector (empty if not a selector issue)"
             }}
 
             Focus on common Playwright issues like:
@@ -403,8 +409,8 @@ class OllamaAIHealingService:
         Returns:
             None
         """
+        ensure_directories()
         healing_dir = AI_HEALING_REPORT_DIR
-        healing_dir.mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = healing_dir / f"{test_name}_{timestamp}_ollama_analysis.md"
@@ -475,6 +481,14 @@ class OllamaAIHealingService:
 
             print(f"Ollama healed test saved: {healed_test_file}")
 
+        # Cache a confident selector fix so the next run uses it with no AI call
+        failed_selector = ai_response.get('failed_selector')
+        new_selector = ai_response.get('healed_selector')
+        if (failed_selector and new_selector and failed_selector != new_selector
+                and ai_response.get('confidence', 0) > self.confidence_threshold):
+            save_healed_selector(context.get('url', ''), failed_selector, new_selector)
+            print(f"🩹 Healed selector cached: {failed_selector} -> {new_selector}")
+
         # Console output
         print(f"\n{'='*80}")
         print(f"OLLAMA AI HEALING: {test_name}")
@@ -43,12 +43,11 @@ class ContextCapture:
             
             # Attach to Allure if available
             try:
-                with open(screenshot_path, "rb") as image_file:
-                    allure.attach(
-                        image_file.read(),
-                        name=f"Screenshot_{test_name or 'capture'}{suffix}",
-                        attachment_type=allure.attachment_type.PNG
-                    )
+                allure.attach.file(
+                    str(screenshot_path),
+                    name=f"Screenshot_{test_name or 'capture'}{suffix}",
+                    attachment_type=allure.attachment_type.PNG
+                )
             except Exception as e:
                 print(f"Warning: Could not attach screenshot to Allure: {e}")
             
@@ -1,14 +1,22 @@
-import os
+from config.settings import settings
 
 # ------------------------------------------------------------------------------
 # Function: debug_print
 # ------------------------------------------------------------------------------
 
-def debug_print(*args, **kwargs):
+def _debug_print(*args, **kwargs):
     """
     Helper function for conditional debug printing based on the DEBUG_MSG environment variable.
     Prints messages only if DEBUG_MSG is set to "true" (case-insensitive).
     Useful for enabling or disabling verbose debug output without code changes.
     """
-    if os.getenv("DEBUG_MSG", "false").lower() == "true":
-        print(*args, **kwargs)
\ No newline at end of file
+    print(*args, **kwargs)
+
+
+def _debug_noop(*args, **kwargs):
+    """Stand-in for debug_print when DEBUG_MSG is off; does nothing."""
+
+
+# DEBUG_MSG is read once (after the .env files are loaded by settings), so a
+# disabled debug_print costs a single empty call instead of an env lookup
+debug_print = _debug_print if settings.DEBUG_MSG else _debug_noop
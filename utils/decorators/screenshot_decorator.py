@@ -1,8 +1,8 @@
 import functools
 import os
-from pathlib import Path
 import allure
 from datetime import datetime
+from config.artifact_paths import SCREENSHOT_DIR, ensure_directories
 
 def screenshot_on_failure(func):
     """
@@ -45,8 +45,9 @@ def screenshot_on_failure(func):
                     page_source = f"{key} fixture"
                     break
                 
-                # Check if this is the raw Playwright 'page' fixture
-                elif key == "page":
+                # Check if this is the raw Playwright 'page' fixture (or a
+                # raw page fixture such as 'authenticated_page')
+                elif key == "page" or (key.endswith("_page") and hasattr(value, "screenshot")):
                     page = value
                     page_source = f"page fixture"
                     break
@@ -64,8 +65,7 @@ def screenshot_on_failure(func):
                 pass
             elif page and os.getenv("SKIP_SCREENSHOTS", "0") != "1":
                 try:
-                    screenshot_dir = Path("test_artifacts/allure/screenshots")
-                    screenshot_dir.mkdir(exist_ok=True)
+                    ensure_directories()
                     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
                     
                     # Use function name or request nodeid if available
@@ -74,7 +74,7 @@ def screenshot_on_failure(func):
                     else:
                         test_name = func.__name__
                     
-                    screenshot_path = screenshot_dir / f"{test_name}_{timestamp}.png"
+                    screenshot_path = SCREENSHOT_DIR / f"{test_name}_{timestamp}.png"
                     
                     # Capture the screenshot
                     await page.screenshot(path=str(screenshot_path), full_page=True)
@@ -0,0 +1,133 @@
+"""
+===============================================================================
+HTML Page Templates for Mocked API Tests
+===============================================================================
+This module holds reusable HTML pages for tests that load content with
+load_html() and exercise mocked API routes. Templates are built once at
+import; tests fill in the per-case values with substitute().
+
+The request/response handling lives in DO_FETCH_JS, which is installed once per
+browser context with add_init_script(); the templates only call
+window.doFetch() and render its result, so each page has very little script.
+
+Usage Example:
+    from utils.html_templates import DO_FETCH_JS, FETCH_TEMPLATE
+
+    await context.add_init_script(DO_FETCH_JS)
+
+    html = FETCH_TEMPLATE.substitute(
+        METHOD="POST",
+        URL="http://localhost/api/users",
+        BODY=json.dumps({"name": "Alice"}),
+        RENDER="`Created: ${data.name}`",
+    )
+    await load_html(page, html)
+
+Author: PMAC
+===============================================================================
+"""
+
+import base64
+from string import Template
+
+# Installed once per context: doFetch(method, url, body) sends a JSON request
+# and resolves to {ok, status, data} with the parsed JSON reply.
+DO_FETCH_JS = """
+window.doFetch = async (method, url, body = null) => {
+    const options = {method};
+    if (body !== null) {
+        options.headers = {'Content-Type': 'application/json'};
+        options.body = JSON.stringify(body);
+    }
+    const response = await fetch(url, options);
+    return {ok: response.ok, status: response.status, data: await response.json()};
+};
+"""
+
+# Sends one request on load and renders the JSON reply (as `data`) into #result.
+#   METHOD: HTTP method, URL: request URL, BODY: JSON literal or null,
+#   RENDER: JS expression producing the #result HTML from `data`
+FETCH_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<body>
+    <div id="result"></div>
+    <script>
+        const result = document.getElementById('result');
+        doFetch('$METHOD', '$URL', $BODY)
+            .then(({data}) => { result.innerHTML = $RENDER; })
+            .catch(() => { result.innerHTML = 'Request failed'; });
+    </script>
+</body>
+</html>
+""")
+
+# Sends one GET on load and, for a non-2xx reply, renders the status and the
+# JSON body's `error` field into #result as "Error: HTTP <status> - <error>".
+#   URL: request URL
+ERROR_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<body>
+    <div id="result"></div>
+    <script>
+        const result = document.getElementById('result');
+        doFetch('GET', '$URL')
+            .then(({ok, status, data}) => {
+                result.innerHTML = ok ? 'Success!' : `Error: HTTP $${status} - $${data.error}`;
+            })
+            .catch(() => { result.innerHTML = 'Request failed'; });
+    </script>
+</body>
+</html>
+""")
+
+# On clicking #test-auth, GETs /api/me with a bearer token and renders either
+# .success ("Welcome, <name>!") or .auth-error into #user-info.
+#   TOKEN: bearer token sent in the Authorization header
+AUTH_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<body>
+    <button id="test-auth">Test Auth</button>
+    <div id="user-info"></div>
+    <script>
+        document.getElementById('test-auth').addEventListener('click', async () => {
+            const userInfo = document.getElementById('user-info');
+            try {
+                const response = await fetch('http://localhost/api/me', {
+                    headers: {'Authorization': 'Bearer $TOKEN'}
+                });
+                if (response.ok) {
+                    const data = await response.json();
+                    userInfo.innerHTML = `<div class="success">Welcome, $${data.user.name}!</div>`;
+                } else {
+                    userInfo.innerHTML = '<div class="auth-error">Authentication failed</div>';
+                }
+            } catch (error) {
+                userInfo.innerHTML = '<div class="error">Request failed</div>';
+            }
+        });
+    </script>
+</body>
+</html>
+""")
+
+# ------------------------------------------------------------------------------
+# Function: load_html
+# ------------------------------------------------------------------------------
+
+async def load_html(page, html):
+    """
+    Load an HTML document into the page through a data: URL.
+
+    Unlike page.set_content(), this is a plain navigation to a URL derived from
+    the markup, so identical test pages share the same URL and the browser's
+    caches can be reused between tests.
+
+    Args:
+        page: Playwright page to load the document into.
+        html (str): Full HTML document.
+    """
+    encoded = base64.b64encode(html.encode("utf-8")).decode("ascii")
+    await page.goto(f"data:text/html;base64,{encoded}")
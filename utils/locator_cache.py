@@ -0,0 +1,155 @@
+"""
+===============================================================================
+Healed Locator Cache
+===============================================================================
+This module keeps a small JSON cache of selectors healed by the AI healing
+service. Healing reports record every confident selector fix here; page
+objects only use those fixes when USE_HEALED_SELECTORS=true, and every swap is
+logged, so a healed selector can never silently mask a real UI change.
+
+Entries are scoped to the URL path of the page they were healed on (e.g.
+"/login"), so a fix for "h2" on one page does not change "h2" everywhere.
+
+Features:
+    ✓ Page path -> original selector -> healed selector, persisted across runs
+    ✓ Substitution is opt-in (USE_HEALED_SELECTORS) and logged per swap
+    ✓ One file per xdist worker, so parallel workers never overwrite each other
+    ✓ Atomic writes so a reader never sees a half-written file
+
+Author: PMAC
+===============================================================================
+"""
+
+import functools
+import json
+import os
+from urllib.parse import urlsplit
+from config.artifact_paths import HEALED_SELECTORS_FILE, ensure_directories
+from config.settings import settings
+
+# ------------------------------------------------------------------------------
+# Function: _page_scope
+# ------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=64)
+def _page_scope(url):
+    """
+    Return the cache scope for a page URL: its path, without host or query.
+
+    Args:
+        url (str): Page URL (may be empty).
+
+    Returns:
+        str: URL path, e.g. "/login" ("/" if the URL has none).
+    """
+    return urlsplit(url or "").path.rstrip("/") or "/"
+
+# ------------------------------------------------------------------------------
+# Function: _worker_file
+# ------------------------------------------------------------------------------
+
+def _worker_file():
+    """
+    Return the cache file this process writes to: the shared file when run
+    without xdist, otherwise one file per worker (healed_selectors.gw0.json, ...).
+
+    Returns:
+        Path: Cache file for this process.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return HEALED_SELECTORS_FILE
+    return HEALED_SELECTORS_FILE.with_name(
+        f"{HEALED_SELECTORS_FILE.stem}.{worker}{HEALED_SELECTORS_FILE.suffix}"
+    )
+
+# ------------------------------------------------------------------------------
+# Function: _read_file
+# ------------------------------------------------------------------------------
+
+def _read_file(path):
+    """
+    Read one cache file.
+
+    Args:
+        path (Path): Cache file.
+
+    Returns:
+        dict: Mapping of page scope to {original: healed} (empty if unreadable).
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {scope: entries for scope, entries in data.items() if isinstance(entries, dict)}
+
+# ------------------------------------------------------------------------------
+# Function: _load_healed_selectors
+# ------------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def _load_healed_selectors():
+    """
+    Read and merge every cache file (shared and per-worker), once per process.
+
+    Returns:
+        dict: Mapping of page scope to {original: healed}.
+    """
+    pattern = f"{HEALED_SELECTORS_FILE.stem}*{HEALED_SELECTORS_FILE.suffix}"
+    merged = {}
+    for path in sorted(HEALED_SELECTORS_FILE.parent.glob(pattern)):
+        for scope, entries in _read_file(path).items():
+            merged.setdefault(scope, {}).update(entries)
+    return merged
+
+# ------------------------------------------------------------------------------
+# Function: healed_selector
+# ------------------------------------------------------------------------------
+
+def healed_selector(selector, url=""):
+    """
+    Return the healed replacement for a selector, or the selector itself.
+    Replacements are only used when USE_HEALED_SELECTORS is enabled.
+
+    Args:
+        selector (str): Selector as written in the page object.
+        url (str): URL of the page object the selector belongs to.
+
+    Returns:
+        str: Selector to use.
+    """
+    if not settings.USE_HEALED_SELECTORS:
+        return selector
+    scope = _page_scope(url)
+    healed = _load_healed_selectors().get(scope, {}).get(selector)
+    if not healed:
+        return selector
+    print(f"🩹 Using healed selector on {scope}: {selector} -> {healed}")
+    return healed
+
+# ------------------------------------------------------------------------------
+# Function: save_healed_selector
+# ------------------------------------------------------------------------------
+
+def save_healed_selector(url, original, healed):
+    """
+    Record a healed selector so later runs can use it without asking the AI again.
+    The process's own cache file is re-read and merged, so entries written
+    earlier in this run (or by earlier runs) are kept.
+
+    Args:
+        url (str): URL of the page the selector failed on.
+        original (str): Selector that failed.
+        healed (str): Replacement selector suggested by the AI.
+    """
+    ensure_directories()
+    path = _worker_file()
+    selectors = _read_file(path)
+    selectors.setdefault(_page_scope(url), {})[original] = healed
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(selectors, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, path)
@@ -39,9 +39,12 @@ Author: Generated for Playwright network mocking
 
 import json
 import asyncio
+import functools
 import pytest_asyncio
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union, Callable
 from playwright.async_api import Page, Route, Request
 
 
@@ -58,11 +61,15 @@ class NetworkMocker:
         Initialize the NetworkMocker with a Playwright page.
         
         Args:
-            page (Page): Playwright Page object to intercept requests for
+            page (Page): Playwright Page object to intercept requests for. A
+                BrowserContext also works, mocking every page in the context.
         """
         self.page = page
         self.mocked_routes = {}
         self.request_log = []
+        # Same entries as request_log, indexed by the (method, url_pattern) mock
+        # that answered them
+        self.requests_by_route = defaultdict(list)
         self.response_log = []
         self.default_delay = 0
         
@@ -119,19 +126,26 @@ class NetworkMocker:
             headers = {"Content-Type": "application/json"}
             
         # Convert dict to JSON string if needed
-        if isinstance(response_data, dict):
-            response_body = json.dumps(response_data)
+        if isinstance(response_data, Mapping):
+            response_body = json.dumps(dict(response_data))
         else:
             response_body = str(response_data)
             
         async def handle_route(route: Route, request: Request):
+            # Let other handlers on the same pattern answer other methods
+            if request.method != method:
+                await route.fallback()
+                return
+
             # Log the intercepted request
-            self.request_log.append({
+            entry = {
                 "method": request.method,
                 "url": request.url,
                 "headers": dict(request.headers),
                 "post_data": request.post_data
-            })
+            }
+            self.request_log.append(entry)
+            self.requests_by_route[(method, url_pattern)].append(entry)
             
             # Apply delay if specified
             if delay > 0:
@@ -148,6 +162,7 @@ class NetworkMocker:
             self.response_log.append({
                 "url": request.url,
                 "status": status,
+                "delay": delay,
                 "body": response_body[:200] + "..." if len(response_body) > 200 else response_body
             })
             
@@ -185,6 +200,66 @@ class NetworkMocker:
             print(f"❌ Invalid JSON in mock file {file_path}: {e}")
             raise
             
+    async def mock_table(self, url_pattern: str, table: Mapping[str, Union[Dict, str]],
+                         default: Union[Dict, str], status: int = 200,
+                         headers: Optional[Dict] = None):
+        """
+        Mock GET requests whose response depends on a fragment of the URL.
+        
+        Bodies are serialized once here, so each hit is a substring check per
+        row and no per-request JSON work.
+        
+        Args:
+            url_pattern (str): URL pattern to intercept
+            table (Mapping[str, Union[Dict, str]]): URL fragment -> response data,
+                checked in order; the first fragment found in the URL wins
+            default (Union[Dict, str]): Response data when no fragment matches
+            status (int): HTTP status code
+            headers (Optional[Dict]): Custom response headers
+            
+        Example:
+            await api_mocker.mock_table("**/api/search*", {
+                "q=laptop": {"results": [{"name": "Gaming Laptop"}], "count": 1},
+            }, default={"results": [], "count": 0})
+        """
+        if headers is None:
+            headers = {"Content-Type": "application/json"}
+
+        def serialize(data):
+            return json.dumps(dict(data)) if isinstance(data, Mapping) else str(data)
+
+        rows = tuple((fragment, serialize(data)) for fragment, data in table.items())
+        default_body = serialize(default)
+
+        async def handle_route(route: Route, request: Request):
+            if request.method != "GET":
+                await route.fallback()
+                return
+
+            url = request.url
+            entry = {
+                "method": request.method,
+                "url": url,
+                "headers": dict(request.headers),
+                "post_data": request.post_data
+            }
+            self.request_log.append(entry)
+            self.requests_by_route[("GET", url_pattern)].append(entry)
+
+            response_body = next((body for fragment, body in rows if fragment in url), default_body)
+            await route.fulfill(status=status, headers=headers, body=response_body)
+
+            self.response_log.append({
+                "url": url,
+                "status": status,
+                "delay": 0,
+                "body": response_body[:200] + "..." if len(response_body) > 200 else response_body
+            })
+
+        self.mocked_routes[f"GET:{url_pattern}"] = handle_route
+        await self.page.route(url_pattern, handle_route)
+        print(f"🔗 Mocked GET {url_pattern} -> {len(rows)} table rows")
+
     async def mock_with_function(self, url_pattern: str, response_function: Callable,
                                 method: str = "GET"):
         """
@@ -204,8 +279,8 @@ class NetworkMocker:
         async def handle_route(route: Route, request: Request):
             try:
                 response_data = response_function(request)
-                if isinstance(response_data, dict):
-                    response_body = json.dumps(response_data)
+                if isinstance(response_data, Mapping):
+                    response_body = json.dumps(dict(response_data))
                     headers = {"Content-Type": "application/json"}
                 else:
                     response_body = str(response_data)
@@ -278,10 +353,25 @@ class NetworkMocker:
             method, pattern = route_key.split(":", 1)
             await self.page.unroute(pattern)
             
+        self.reset()
+        print("🧹 All mocks cleared")
+
+    def reset(self):
+        """
+        Forget registered mocks and clear the request/response logs without
+        touching the page. Use when the page's routes are going away anyway.
+        """
         self.mocked_routes.clear()
+        self.clear_logs()
+
+    def clear_logs(self):
+        """
+        Clear the request/response logs but keep the registered mocks, e.g.
+        between tests that share one set of routes.
+        """
         self.request_log.clear()
+        self.requests_by_route.clear()
         self.response_log.clear()
-        print("🧹 All mocks cleared")
         
     def get_request_log(self) -> list:
         """
@@ -291,6 +381,36 @@ class NetworkMocker:
             list: List of request dictionaries
         """
         return self.request_log.copy()
+
+    @property
+    def request_count(self) -> int:
+        """Number of intercepted requests, without copying the log."""
+        return len(self.request_log)
+
+    def get_request(self, index: int) -> dict:
+        """
+        Get one intercepted request by position, without copying the log.
+        
+        Args:
+            index (int): Position in the log (negative values count from the end)
+            
+        Returns:
+            dict: The request dictionary
+        """
+        return self.request_log[index]
+
+    def get_requests(self, method: str, url_pattern: str) -> list:
+        """
+        Get the requests answered by one mock, without scanning the whole log.
+        
+        Args:
+            method (str): HTTP method the mock was registered for
+            url_pattern (str): URL pattern the mock was registered with
+            
+        Returns:
+            list: List of request dictionaries, oldest first
+        """
+        return list(self.requests_by_route.get((method, url_pattern), ()))
         
     def get_response_log(self) -> list:
         """
@@ -351,8 +471,10 @@ async def api_mocker(page: Page):
     
     yield mocker
     
-    # Cleanup after test
-    await mocker.clear_mocks()
+    # Cleanup after test: the page fixture closes the page (or its whole browser
+    # context) next, which drops every page route with it, so only the local
+    # state is reset here instead of unrouting each pattern one round-trip at a time
+    mocker.reset()
 
 
 def create_mock_data_file(file_path: str, data: Dict[str, Any]):
@@ -402,7 +524,8 @@ MOCK_TEMPLATES = {
 }
 
 
-def get_mock_template(template_name: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def get_mock_template(template_name: str) -> Mapping[str, Any]:
     """
     Get a predefined mock data template.
     
@@ -410,10 +533,10 @@ def get_mock_template(template_name: str) -> Dict[str, Any]:
         template_name (str): Name of the template (users, products, empty_list, error, loading)
         
     Returns:
-        Dict[str, Any]: Mock data template
+        Mapping[str, Any]: Read-only mock data template, cached per name
         
     Example:
         user_data = get_mock_template("users")
         await api_mocker.mock_get("/api/users", user_data)
     """
-    return MOCK_TEMPLATES.get(template_name, {}).copy()
\ No newline at end of file
+    return MappingProxyType(MOCK_TEMPLATES.get(template_name, {}))
\ No newline at end of file
@@ -42,11 +42,9 @@ Author: Generated for Playwright visual regression testing
 import os
 import pytest
 import pytest_asyncio
-import numpy as np
 from playwright.async_api import Page
-from PIL import Image, ImageChops
 from config.artifact_paths import (
-    VISUAL_BASELINE_DIR, VISUAL_CURRENT_DIR, VISUAL_DIFF_DIR
+    VISUAL_BASELINE_DIR, VISUAL_CURRENT_DIR, VISUAL_DIFF_DIR, ensure_directories
 )
 
 # Directory configuration for visual regression files
@@ -54,11 +52,6 @@ BASELINE_DIR = str(VISUAL_BASELINE_DIR)
 CURRENT_DIR = str(VISUAL_CURRENT_DIR)
 DIFF_DIR = str(VISUAL_DIFF_DIR)
 
-# Ensure directories exist
-os.makedirs(BASELINE_DIR, exist_ok=True)
-os.makedirs(CURRENT_DIR, exist_ok=True)
-os.makedirs(DIFF_DIR, exist_ok=True)
-
 
 def compare_images(baseline_path, current_path, diff_path, tolerance=0.01):
     """
@@ -84,6 +77,10 @@ def compare_images(baseline_path, current_path, diff_path, tolerance=0.01):
         if not matches:
             print(f"Images differ by {ratio:.2%}")
     """
+    # Imported here so collecting tests never pays for numpy/Pillow start-up
+    import numpy as np
+    from PIL import Image, ImageChops
+
     try:
         # Load images and convert to RGB for consistent comparison
         img1 = Image.open(baseline_path).convert("RGB")
@@ -170,6 +167,8 @@ async def visual_regression(page: Page):
             # Element-specific screenshot
             await visual_regression("header", selector="#main-header", tolerance=0.01)
     """
+    # Ensure directories exist
+    ensure_directories()
     
     async def _compare(name: str, selector: str = None, full_page: bool = True, tolerance: float = 0.01):
         """